@@ -1,14 +1,48 @@
 import config.base
 
+import contextlib
+import functools
 import re
 import os
 import shutil
 
+# Patterns used to classify the arguments in the verbose output of the linker
+_RE_SYSLIB  = re.compile(r'^-l(ang.*|crt[0-9].o|crtbegin.o|c|gcc|gcc_ext(.[0-9]+)*|System|cygwin|xlomp_ser|crt[0-9].[0-9][0-9].[0-9].o)$')
+_RE_QUOTED  = re.compile(r"'[^']*'")
+_RE_TOKEN   = re.compile(r'\S+')
+_RE_NAGLIB  = re.compile(r'/libf[1-9][0-9]rts.a[^/]*$')
+_RE_ABSOFT  = re.compile(r'absoft', re.IGNORECASE)
+_RE_LD_RUN_PATH = re.compile(r'^.*LD_RUN_PATH *= *([^ ]*).*')
+
+# Library arguments that are always dropped from the linker output
+_LITERAL_SKIPS = frozenset(['-long_double', '-lkernel32'])
+
+_RE_XCODE_VERBOSE = re.compile(r'^ld: warning: text-based stub file.*(\n|$)', re.MULTILINE)
+_RE_XCODE_VERBOSE_CR = re.compile(r'^ld: warning: text-based stub file.*(\n|$)|\\\n', re.MULTILINE)
+
 def remove_xcode_verbose(buf):
-  retbuf =[]
-  for line in buf.splitlines():
-    if not line.startswith('ld: warning: text-based stub file'): retbuf.append(line)
-  return ('\n').join(retbuf)
+  return _RE_XCODE_VERBOSE.sub('', buf)
+
+@functools.lru_cache(maxsize=None)
+def normpath(path):
+  '''Memoized os.path.normpath(), the same directories show up many times in the linker output'''
+  return os.path.normpath(path)
+
+def abspath(path):
+  '''Same as os.path.abspath() but skips the os.getcwd() call for paths that are already absolute
+     - Only absolute paths are memoized since configure changes the working directory'''
+  if os.path.isabs(path): return normpath(path)
+  return os.path.abspath(path)
+
+# Fortran name mangling functions, indexed by the value of Configure.fortranMangling
+_FORTRAN_MANGLERS = {
+  'underscore': lambda self, name: name.lower()+'__' if self.fortranManglingDoubleUnderscore and name.find('_') >= 0 else name.lower()+'_',
+  'unchanged':  lambda self, name: name.lower(),
+  'caps':       lambda self, name: name.upper(),
+  'stdcall':    lambda self, name: name.upper()}
+
+# Linker flags from config.setCompilers that are returned joined into a single string
+_LINKER_FLAG_NAMES = frozenset(['CC_LINKER_FLAGS', 'FC_LINKER_FLAGS', 'CXX_LINKER_FLAGS', 'CUDAC_LINKER_FLAGS', 'HIPC_LINKER_FLAGS', 'SYCLC_LINKER_FLAGS', 'sharedLibraryFlags', 'dynamicLibraryFlags'])
 
 class MissingProcessor(AttributeError):
   pass
@@ -26,25 +60,52 @@ class Configure(config.base.Configure):
     self.clibs            = []  # libraries needed for linking using the C++ or Fortran compiler C source code compiled with C
     self.cxxlibs          = []  # libraries needed for linking using the C or Fortran compiler C++ source code compiled with C++
                                 # clibs is only used in this file. The final link line that PETSc users use includes cxxlibs and flibs
-    self.skipdefaultpaths = []
+    self.skipdefaultpaths = None
     self.cxxCompileC      = False
     self.cxxRestrict      = ' '
     self.c99flag          = None
+    self.stdAtomic        = None  # result of the checkStdAtomic() compile
+    self.compilerIdentity = {}  # cache of the config.setCompilers.Configure.isXXX() compiler checks
     return
 
   def getSkipDefaultPaths(self):
-    if len(self.skipdefaultpaths):
-      return self.skipdefaultpaths
-    else:
-      self.skipdefaultpaths = ['/usr/lib','/lib','/usr/lib64','/lib64']
+    if self.skipdefaultpaths is None:
+      skipdefaultpaths = ['/usr/lib','/lib','/usr/lib64','/lib64']
       for loc in ['/usr/lib','/lib']:
         for arch in ['x86_64','i386','aarch64']:
-          self.skipdefaultpaths.append(os.path.join(loc,arch+'-linux-gnu'))
+          skipdefaultpaths.append(os.path.join(loc,arch+'-linux-gnu'))
       conda_sysrt = os.getenv('CONDA_BUILD_SYSROOT')
       if conda_sysrt:
         conda_sysrt = os.path.abspath(conda_sysrt)
-        self.skipdefaultpaths.extend([conda_sysrt+lib for lib in self.skipdefaultpaths])
-      return self.skipdefaultpaths
+        skipdefaultpaths.extend([conda_sysrt+lib for lib in skipdefaultpaths])
+      # stored as a frozenset since it is only used for membership tests while parsing the linker output
+      self.skipdefaultpaths = frozenset(skipdefaultpaths)
+    return self.skipdefaultpaths
+
+  def isCompiler(self, check, language):
+    '''Returns the result of config.setCompilers.Configure.<check>() for the compiler of the given language, e.g. isCompiler('isCray', 'C')
+       The result is cached since each check runs the compiler'''
+    compiler = self.getCompiler(language)
+    key = (check, compiler)
+    if not key in self.compilerIdentity:
+      self.compilerIdentity[key] = getattr(config.setCompilers.Configure, check)(compiler, self.log)
+    return self.compilerIdentity[key]
+
+  def getLibArguments(self, libs):
+    '''Returns the link line arguments for the list of libraries as a single string
+       The libraries are translated on every call: the result depends on the setCompilers shared linker flags and
+       getLibArgument() warns about missing library directories each time'''
+    return ' '.join(map(self.libraries.getLibArgument, libs))
+
+  @contextlib.contextmanager
+  def extraLibraries(self, libs):
+    '''Puts the link line arguments for libs in front of setCompilers.LIBS, the original value is restored on exit'''
+    oldLibs = self.setCompilers.LIBS
+    self.setCompilers.LIBS = self.getLibArguments(libs)+' '+oldLibs
+    try:
+      yield
+    finally:
+      self.setCompilers.LIBS = oldLibs
 
   def setupHelp(self, help):
     import nargs
@@ -75,15 +136,14 @@ class Configure(config.base.Configure):
     names['LD_SHARED'] = 'No shared linker found.'
     names['CC_LD'] = 'No C linker found.'
     names['dynamicLinker'] = 'No dynamic linker found.'
+    # the flag names only depend on the language passed in, so there is no need to push the language
     for language in ['C', 'CUDA', 'HIP', 'SYCL', 'Cxx', 'FC']:
-      self.pushLanguage(language)
       key = self.getCompilerFlagsName(language, 0)
       names[key] = 'No '+language+' compiler flags found.'
       key = self.getCompilerFlagsName(language, 1)
       names[key] = 'No '+language+' compiler flags found.'
       key = self.getLinkerFlagsName(language)
       names[key] = 'No '+language+' linker flags found.'
-      self.popLanguage()
     names['CPPFLAGS'] = 'No preprocessor flags found.'
     names['FPPFLAGS'] = 'No Fortran preprocessor flags found.'
     names['CUDAPPFLAGS'] = 'No CUDA preprocessor flags found.'
@@ -104,15 +164,18 @@ class Configure(config.base.Configure):
     return
 
   def __getattr__(self, name):
-    if 'dispatchNames' in self.__dict__:
-      if name in self.dispatchNames:
-        if not hasattr(self.setCompilers, name):
-          raise MissingProcessor(self.dispatchNames[name])
-        return getattr(self.setCompilers, name)
-      if name in ['CC_LINKER_FLAGS', 'FC_LINKER_FLAGS', 'CXX_LINKER_FLAGS', 'CUDAC_LINKER_FLAGS', 'HIPC_LINKER_FLAGS', 'SYCLC_LINKER_FLAGS','sharedLibraryFlags', 'dynamicLibraryFlags']:
-        flags = getattr(self.setCompilers, name)
-        if not isinstance(flags, list): flags = [flags]
-        return ' '.join(flags)
+    try:
+      dispatchNames = self.__dict__['dispatchNames']
+    except KeyError:
+      raise AttributeError('Configure attribute not found: '+name)
+    if name in dispatchNames:
+      if not hasattr(self.setCompilers, name):
+        raise MissingProcessor(dispatchNames[name])
+      return getattr(self.setCompilers, name)
+    if name in _LINKER_FLAG_NAMES:
+      flags = getattr(self.setCompilers, name)
+      if not isinstance(flags, list): flags = [flags]
+      return ' '.join(flags)
     raise AttributeError('Configure attribute not found: '+name)
 
   def __setattr__(self, name, value):
@@ -124,11 +187,15 @@ class Configure(config.base.Configure):
 
   def checkCxxRestrict(self):
     '''Check for the CXX restrict keyword equivalent to C99 restrict'''
-    with self.Language('Cxx'):
-      for kw in ['__restrict', ' __restrict__', 'restrict', ' ']:
-        if self.checkCompile('', 'float * '+kw+' x;\n(void)x'):
-          self.cxxRestrict = kw
-          break
+    if self.isGCXX:
+      # all GNU C++ compilers accept __restrict so there is no need to run the compiler
+      self.cxxRestrict = '__restrict'
+    else:
+      with self.Language('Cxx'):
+        for kw in ['__restrict', ' __restrict__', 'restrict', ' ']:
+          if self.checkCompile('', 'float * '+kw+' x;\n(void)x'):
+            self.cxxRestrict = kw
+            break
     self.logPrint('Set Cxx restrict keyword to : '+self.cxxRestrict, 4, 'compilers')
     self.addDefine('CXX_RESTRICT', self.cxxRestrict)
     return
@@ -144,11 +211,12 @@ class Configure(config.base.Configure):
       self.logPrint('Cannot compile C function: '+func1, 3, 'compilers')
       self.popLanguage()
       return found
-    if not os.path.isfile(self.compilerObj):
+    try:
+      os.replace(self.compilerObj, obj1)
+    except FileNotFoundError:
       self.logPrint('Cannot locate object file: '+os.path.abspath(self.compilerObj), 3, 'compilers')
       self.popLanguage()
       return found
-    os.rename(self.compilerObj, obj1)
     self.popLanguage()
     # Link the test object against a Fortran driver
     self.pushLanguage(language2)
@@ -159,44 +227,199 @@ class Configure(config.base.Configure):
         extraObjs = []
       if extralibs is None:
         extralibs = self.clibs
-      self.setCompilers.LIBS = ' '.join(extraObjs)+' '+' '.join([self.libraries.getLibArgument(lib) for lib in extralibs])+' '+self.setCompilers.LIBS
+      self.setCompilers.LIBS = ' '.join(extraObjs)+' '+self.getLibArguments(extralibs)+' '+self.setCompilers.LIBS
     found = self.checkLink("", func2,codeBegin = " ", codeEnd = " ")
     self.setCompilers.LIBS = oldLIBS
     self.popLanguage()
-    if os.path.isfile(obj1):
+    try:
       os.remove(obj1)
+    except FileNotFoundError:
+      pass
     return found
 
+  def parseLinkerVerboseOutput(self, output, language):
+    '''Parses the verbose output of the C or C++ linker and returns the libraries needed to link code compiled with that language using another linker'''
+    # Cray: remove libsci link
+    iscray = self.isCompiler('isCray', language)
+
+    output = remove_xcode_verbose(output)
+    # PGI: kill anything enclosed in single quotes
+    quotes = output.count('\'')
+    if quotes%2:
+      # Cray has crazy non-matching single quotes so skip the removal for C
+      if language == 'Cxx': raise RuntimeError('Mismatched single quotes in C++ library string')
+    elif quotes:
+      output = _RE_QUOTED.sub('', output)
+
+    # The easiest thing to do for xlc output is to replace all the commas
+    # with spaces.  Try to only do that if the output is really from xlc,
+    # since doing that causes problems on other systems.
+    if 'XL_CONFIG' in output:
+      output = output.replace(',', ' ')
+
+    # Parse output
+    tokens = output.split()
+    libs = []
+    skipdefaultpaths = self.getSkipDefaultPaths()
+    lflags  = set()
+    rpathflags = set()
+    sharedLinkerFlag = self.setCompilers.CSharedLinkerFlag
+    # the C++ libraries skip anything already in the C list
+    if language == 'Cxx': clibs = frozenset(self.clibs)
+    else: clibs = frozenset()
+    # collect the per argument messages and write them to the log at once
+    logLines = []
+    i = 0
+    n = len(tokens)
+    while i < n:
+      arg = tokens[i]
+      i += 1
+      logLines.append('Checking arg '+arg)
+
+      # Intel compiler sometimes puts " " around an option like "-lsomething"
+      if arg.startswith('"') and arg.endswith('"'):
+        arg = arg[1:-1]
+      # Intel also puts several options together inside a " " so the last one
+      # has a stray " at the end
+      if arg.endswith('"') and arg[:-1].find('"') == -1:
+        arg = arg[:-1]
+      # Dispatch on the leading characters so only the patterns that can match are tried
+      s2 = arg[:2]
+      if s2 == '-l':
+        # Intel 11 has a bogus -long_double option, Windows kernel32 is always linked
+        if arg in _LITERAL_SKIPS:
+          continue
+        # if options of type -L foobar
+        if arg == '-lto_library':
+          if i == n: break
+          lib = tokens[i]
+          i += 1
+          logLines.append('Skipping Apple LLVM linker option -lto_library '+lib)
+          continue
+        # Check for system libraries
+        m = _RE_SYSLIB.match(arg)
+        if m:
+          logLines.append('Skipping system library: '+arg)
+          continue
+        # Check for special library arguments
+        if arg not in lflags:
+          if language == 'Cxx' and arg == '-lLTO' and self.setCompilers.isDarwin(self.log):
+            logLines.append('Skipping -lTO')
+            continue
+          elif iscray and (arg == '-lsci_cray_mpi' or arg == '-lsci_cray' or arg == '-lsci_cray_mp'):
+            logLines.append('Skipping CRAY LIBSCI library: '+arg)
+            continue
+          elif arg in clibs:
+            logLines.append('Library already in C list so skipping in C++')
+            continue
+          else:
+            lflags.add(arg)
+          logLines.append('Found library: '+arg)
+          libs.append(arg)
+        else:
+          logLines.append('Already in lflags: '+arg)
+        continue
+      elif s2 == '-L':
+        if arg == '-L':
+          if i == n: break
+          lib = tokens[i]
+          i += 1
+          logLines.append('Found -L '+lib)
+          libs.append('-L'+lib)
+          continue
+        if arg[2:] in skipdefaultpaths: continue # skip the normalization for the common default paths
+        arg = abspath(arg[2:])
+        if arg in skipdefaultpaths: continue
+        arg = '-L'+arg
+        if arg not in lflags:
+          lflags.add(arg)
+          logLines.append('Found library directory: '+arg)
+          libs.append(arg)
+        continue
+      elif s2[:1] == '/':
+        # Check for full library name
+        if arg.endswith('.a'):
+          if arg not in lflags:
+            lflags.add(arg)
+            logLines.append('Found full library spec: '+arg)
+            libs.append(arg)
+          else:
+            logLines.append('Already in lflags: '+arg)
+          continue
+        # Check for full dylib library name
+        if arg.endswith('.dylib'):
+          if arg not in lflags and not (language == 'Cxx' and arg.endswith('LTO.dylib')):
+            lflags.add(arg)
+            logLines.append('Found full library spec: '+arg)
+            libs.append(arg)
+          else:
+            logLines.append('Already in lflags: '+arg)
+          continue
+      # Check for '-rpath /sharedlibpath/ or -R /sharedlibpath/'
+      elif arg == '-rpath' or arg == '-R':
+        if i == n: break
+        lib = tokens[i]
+        i += 1
+        if lib.startswith('-') or lib.startswith('@loader_path'): continue # perhaps the path was striped due to quotes?
+        if lib.startswith('"') and lib.endswith('"') and lib.find(' ') == -1: lib = lib[1:-1]
+        if lib in skipdefaultpaths: continue
+        lib = abspath(lib)
+        if lib in skipdefaultpaths: continue
+        if lib not in rpathflags:
+          rpathflags.add(lib)
+          logLines.append('Found '+arg+' library: '+lib)
+          libs.append(sharedLinkerFlag+lib)
+        else:
+          logLines.append('Already in rpathflags, skipping: '+arg)
+        continue
+      # Check for '-R/sharedlibpath/'
+      elif s2 == '-R':
+        lib = abspath(arg[2:])
+        if lib not in rpathflags:
+          rpathflags.add(lib)
+          logLines.append('Found -R library: '+lib)
+          libs.append(sharedLinkerFlag+lib)
+        else:
+          logLines.append('Already in rpathflags, skipping: '+arg)
+        continue
+      logLines.append('Unknown arg '+arg)
+    if logLines:
+      self.logPrint('\n'.join(logLines), 4, 'compilers')
+
+    linklibs = []
+    rewrite = not self.setCompilers.staticLibraries and not sharedLinkerFlag == '-L'
+    for lib in libs:
+      if rewrite and lib.startswith('-L'):
+        linklibs.append(sharedLinkerFlag+lib[2:])
+      linklibs.append(lib)
+    return linklibs
+
   def checkCLibraries(self):
     '''Determines the libraries needed to link using the C++ or Fortran compiler C source code compiled with C. Result is stored in clibs'''
     skipclibraries = 1
     if hasattr(self.setCompilers, 'FC'):
-      self.setCompilers.saveLog()
       try:
-        if self.checkCrossLink('#include <stdio.h>\nvoid asub(void)\n{char s[16];printf("testing %s",s);}\n',"     program main\n      print*,'testing'\n      stop\n      end\n",language1='C',language2='FC'):
-          self.logWrite(self.setCompilers.restoreLog())
+        with self.setCompilers.loggedProbe():
+          linked = self.checkCrossLink('#include <stdio.h>\nvoid asub(void)\n{char s[16];printf("testing %s",s);}\n',"     program main\n      print*,'testing'\n      stop\n      end\n",language1='C',language2='FC')
+        if linked:
           self.logPrint('C libraries are not needed when using Fortran linker')
         else:
-          self.logWrite(self.setCompilers.restoreLog())
           self.logPrint('C code cannot directly be linked with Fortran linker, therefore will determine needed C libraries')
           skipclibraries = 0
       except RuntimeError as e:
-        self.logWrite(self.setCompilers.restoreLog())
         self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
         self.logPrint('C code cannot directly be linked with Fortran linker, therefore will determine needed C libraries')
         skipclibraries = 0
     if hasattr(self.setCompilers, 'CXX'):
-      self.setCompilers.saveLog()
       try:
-        if self.checkCrossLink('#include <stdio.h>\nvoid asub(void)\n{char s[16];printf("testing %s",s);}\n',"int main(int argc,char **args)\n{return 0;}\n",language1='C',language2='C++'):
-          self.logWrite(self.setCompilers.restoreLog())
+        with self.setCompilers.loggedProbe():
+          linked = self.checkCrossLink('#include <stdio.h>\nvoid asub(void)\n{char s[16];printf("testing %s",s);}\n',"int main(int argc,char **args)\n{return 0;}\n",language1='C',language2='C++')
+        if linked:
           self.logPrint('C libraries are not needed when using C++ linker')
         else:
-          self.logWrite(self.setCompilers.restoreLog())
           self.logPrint('C code cannot directly be linked with C++ linker, therefore will determine needed C libraries')
           skipclibraries = 0
       except RuntimeError as e:
-        self.logWrite(self.setCompilers.restoreLog())
         self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
         self.logPrint('C code cannot directly be linked with C++ linker, therefore will determine needed C libraries')
         skipclibraries = 0
@@ -209,159 +432,25 @@ class Configure(config.base.Configure):
     self.setCompilers.LDFLAGS = oldFlags
     self.popLanguage()
 
-    # Cray: remove libsci link
-    iscray = config.setCompilers.Configure.isCray(self.getCompiler('C'), self.log)
-
-    output = remove_xcode_verbose(output)
-    # PGI: kill anything enclosed in single quotes
-    if output.find('\'') >= 0:
-      # Cray has crazy non-matching single quotes so skip the removal
-      if not output.count('\'')%2:
-        while output.find('\'') >= 0:
-          start = output.index('\'')
-          end   = output.index('\'', start+1)+1
-          output = output.replace(output[start:end], '')
-
-    # The easiest thing to do for xlc output is to replace all the commas
-    # with spaces.  Try to only do that if the output is really from xlc,
-    # since doing that causes problems on other systems.
-    if output.find('XL_CONFIG') >= 0:
-      output = output.replace(',', ' ')
-
-    # Parse output
-    argIter = iter(output.split())
-    clibs = []
-    skipdefaultpaths = self.getSkipDefaultPaths()
-    lflags  = []
-    rpathflags = []
-    try:
-      while 1:
-        arg = next(argIter)
-        self.logPrint( 'Checking arg '+arg, 4, 'compilers')
-
-        # Intel compiler sometimes puts " " around an option like "-lsomething"
-        if arg.startswith('"') and arg.endswith('"'):
-          arg = arg[1:-1]
-        # Intel also puts several options together inside a " " so the last one
-        # has a stray " at the end
-        if arg.endswith('"') and arg[:-1].find('"') == -1:
-          arg = arg[:-1]
-        # Intel 11 has a bogus -long_double option
-        if arg == '-long_double':
-          continue
-        # if options of type -L foobar
-        if arg == '-lto_library':
-          lib = next(argIter)
-          self.logPrint('Skipping Apple LLVM linker option -lto_library '+lib)
-          continue
-        if arg == '-L':
-          lib = next(argIter)
-          self.logPrint('Found -L '+lib, 4, 'compilers')
-          clibs.append('-L'+lib)
-          continue
-        # Check for full library name
-        m = re.match(r'^/.*\.a$', arg)
-        if m:
-          if not arg in lflags:
-            lflags.append(arg)
-            self.logPrint('Found full library spec: '+arg, 4, 'compilers')
-            clibs.append(arg)
-          else:
-            self.logPrint('Skipping, already in lflags: '+arg, 4, 'compilers')
-          continue
-        # Check for full dylib library name
-        m = re.match(r'^/.*\.dylib$', arg)
-        if m:
-          if not arg in lflags:
-            lflags.append(arg)
-            self.logPrint('Found full library spec: '+arg, 4, 'compilers')
-            clibs.append(arg)
-          else:
-            self.logPrint('already in lflags: '+arg, 4, 'compilers')
-          continue
-        # Check for system libraries
-        m = re.match(r'^-l(ang.*|crt[0-9].o|crtbegin.o|c|gcc|gcc_ext(.[0-9]+)*|System|cygwin|xlomp_ser|crt[0-9].[0-9][0-9].[0-9].o)$', arg)
-        if m:
-          self.logPrint('Skipping system library: '+arg, 4, 'compilers')
-          continue
-        # Check for special library arguments
-        m = re.match(r'^-l.*$', arg)
-        if m:
-          if not arg in lflags:
-            if arg == '-lkernel32':
-              continue
-            elif iscray and (arg == '-lsci_cray_mpi' or arg == '-lsci_cray' or arg == '-lsci_cray_mp'):
-              self.logPrint('Skipping CRAY LIBSCI library: '+arg, 4, 'compilers')
-              continue
-            else:
-              lflags.append(arg)
-            self.logPrint('Found library : '+arg, 4, 'compilers')
-            clibs.append(arg)
-          continue
-        m = re.match(r'^-L.*$', arg)
-        if m:
-          arg = os.path.abspath(arg[2:])
-          if arg in skipdefaultpaths: continue
-          arg = '-L'+arg
-          lflags.append(arg)
-          self.logPrint('Found library directory: '+arg, 4, 'compilers')
-          clibs.append(arg)
-          continue
-        # Check for '-rpath /sharedlibpath/ or -R /sharedlibpath/'
-        if arg == '-rpath' or arg == '-R':
-          lib = next(argIter)
-          if lib.startswith('-') or lib.startswith('@loader_path'): continue # perhaps the path was striped due to quotes?
-          if lib.startswith('"') and lib.endswith('"') and lib.find(' ') == -1: lib = lib[1:-1]
-          lib = os.path.abspath(lib)
-          if lib in skipdefaultpaths: continue
-          if not lib in rpathflags:
-            rpathflags.append(lib)
-            self.logPrint('Found '+arg+' library: '+lib, 4, 'compilers')
-            clibs.append(self.setCompilers.CSharedLinkerFlag+lib)
-          else:
-            self.logPrint('Already in rpathflags, skipping'+arg, 4, 'compilers')
-          continue
-        # Check for '-R/sharedlibpath/'
-        m = re.match(r'^-R.*$', arg)
-        if m:
-          lib = os.path.abspath(arg[2:])
-          if not lib in rpathflags:
-            rpathflags.append(lib)
-            self.logPrint('Found -R library: '+lib, 4, 'compilers')
-            clibs.append(self.setCompilers.CSharedLinkerFlag+lib)
-          else:
-            self.logPrint('Already in rpathflags, skipping'+arg, 4, 'compilers')
-          continue
-        self.logPrint('Unknown arg '+arg, 4, 'compilers')
-    except StopIteration:
-      pass
-
-    self.clibs = []
-    for lib in clibs:
-      if not self.setCompilers.staticLibraries and lib.startswith('-L') and not self.setCompilers.CSharedLinkerFlag == '-L':
-        self.clibs.append(self.setCompilers.CSharedLinkerFlag+lib[2:])
-      self.clibs.append(lib)
+    self.clibs = self.parseLinkerVerboseOutput(output, 'C')
 
     self.logPrint('Libraries needed to link C code with another linker: '+str(self.clibs), 3, 'compilers')
 
     if hasattr(self.setCompilers, 'FC') or hasattr(self.setCompilers, 'CXX'):
       self.logPrint('Check that C libraries can be used with Fortran as linker', 4, 'compilers')
       oldLibs = self.setCompilers.LIBS
-      self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.clibs])+' '+self.setCompilers.LIBS
+      self.setCompilers.LIBS = self.getLibArguments(self.clibs)+' '+self.setCompilers.LIBS
     if hasattr(self.setCompilers, 'FC'):
-      self.setCompilers.saveLog()
       try:
-        self.setCompilers.checkCompiler('FC')
+        with self.setCompilers.loggedProbe():
+          self.setCompilers.checkCompiler('FC', runFirst = True)
       except RuntimeError as e:
         self.setCompilers.LIBS = oldLibs
-        self.logWrite(self.setCompilers.restoreLog())
         self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
         raise RuntimeError('C libraries cannot directly be used with Fortran as linker')
       except OSError as e:
         self.setCompilers.LIBS = oldLibs
-        self.logWrite(self.setCompilers.restoreLog())
         raise e
-      self.logWrite(self.setCompilers.restoreLog())
     return
 
   def checkCFormatting(self):
@@ -378,47 +467,42 @@ class Configure(config.base.Configure):
   def checkDynamicLoadFlag(self):
     '''Checks that dlopen() takes RTLD_XXX, and defines PETSC_HAVE_RTLD_XXX if it does'''
     if self.setCompilers.dynamicLibraries:
-      if self.checkLink('#include <dlfcn.h>\nchar *libname;\n', 'dlopen(libname, RTLD_LAZY);dlopen(libname, RTLD_NOW);dlopen(libname, RTLD_LOCAL);dlopen(libname, RTLD_GLOBAL)'):
-        self.addDefine('HAVE_RTLD_LAZY', 1)
-        self.addDefine('HAVE_RTLD_NOW', 1)
-        self.addDefine('HAVE_RTLD_LOCAL', 1)
-        self.addDefine('HAVE_RTLD_GLOBAL', 1)
-        return
-      if self.checkLink('#include <dlfcn.h>\nchar *libname;\n', 'dlopen(libname, RTLD_LAZY)'):
-        self.addDefine('HAVE_RTLD_LAZY', 1)
-      if self.checkLink('#include <dlfcn.h>\nchar *libname;\n', 'dlopen(libname, RTLD_NOW)'):
-        self.addDefine('HAVE_RTLD_NOW', 1)
-      if self.checkLink('#include <dlfcn.h>\nchar *libname;\n', 'dlopen(libname, RTLD_LOCAL)'):
-        self.addDefine('HAVE_RTLD_LOCAL', 1)
-      if self.checkLink('#include <dlfcn.h>\nchar *libname;\n', 'dlopen(libname, RTLD_GLOBAL)'):
-        self.addDefine('HAVE_RTLD_GLOBAL', 1)
+      flags = ['RTLD_LAZY', 'RTLD_NOW', 'RTLD_LOCAL', 'RTLD_GLOBAL']
+      if not self.checkLink('#include <dlfcn.h>\nchar *libname;\n', ''.join(['dlopen(libname, '+flag+');' for flag in flags])):
+        # find the flags that dlfcn.h provides with a single preprocessor run instead of a link test for each flag
+        output = self.outputPreprocess('#include <dlfcn.h>\n'+''.join(['#if defined('+flag+')\npetsc_have_'+flag+'\n#endif\n' for flag in flags]))
+        flags = [flag for flag in flags if 'petsc_have_'+flag in output]
+        # link those flags together, if that fails link each one separately so the flags that work are still defined
+        if len(flags) < 2 or not self.checkLink('#include <dlfcn.h>\nchar *libname;\n', ''.join(['dlopen(libname, '+flag+');' for flag in flags])):
+          flags = [flag for flag in flags if self.checkLink('#include <dlfcn.h>\nchar *libname;\n', 'dlopen(libname, '+flag+');')]
+      for flag in flags:
+        self.addDefine('HAVE_'+flag, 1)
     return
 
   def checkCxxOptionalExtensions(self):
     '''Check whether the C++ compiler (IBM xlC, OSF5) need special flag for .c files which contain C++'''
-    self.setCompilers.saveLog()
-    self.setCompilers.pushLanguage('Cxx')
-    cxxObj = self.framework.getCompilerObject('Cxx')
-    oldExt = cxxObj.sourceExtension
-    cxxObj.sourceExtension = self.framework.getCompilerObject('C').sourceExtension
-    for flag in ['', '-+', '-x cxx -tlocal', '-Kc++']:
-      try:
-        self.setCompilers.addCompilerFlag(flag, body = 'class somename { public: int i; };\nsomename b;\nb.i = 0;\n(void)b.i')
-        self.cxxCompileC = True
-        break
-      except RuntimeError:
-        pass
-    if not self.cxxCompileC:
-      for flag in ['-x c++', '-TP','-P']:
+    with self.setCompilers.loggedProbe():
+      self.setCompilers.pushLanguage('Cxx')
+      cxxObj = self.framework.getCompilerObject('Cxx')
+      oldExt = cxxObj.sourceExtension
+      cxxObj.sourceExtension = self.framework.getCompilerObject('C').sourceExtension
+      for flag in ['', '-+', '-x cxx -tlocal', '-Kc++']:
         try:
-          self.setCompilers.addCompilerFlag(flag, body = 'class somename { public: int i; };\nsomename b;\nb.i = 0;\n(void)b.i', compilerOnly = 1)
+          self.setCompilers.addCompilerFlag(flag, body = 'class somename { public: int i; };\nsomename b;\nb.i = 0;\n(void)b.i')
           self.cxxCompileC = True
           break
         except RuntimeError:
           pass
-    cxxObj.sourceExtension = oldExt
-    self.setCompilers.popLanguage()
-    self.logWrite(self.setCompilers.restoreLog())
+      if not self.cxxCompileC:
+        for flag in ['-x c++', '-TP','-P']:
+          try:
+            self.setCompilers.addCompilerFlag(flag, body = 'class somename { public: int i; };\nsomename b;\nb.i = 0;\n(void)b.i', compilerOnly = 1)
+            self.cxxCompileC = True
+            break
+          except RuntimeError:
+            pass
+      cxxObj.sourceExtension = oldExt
+      self.setCompilers.popLanguage()
     return
 
   def checkCxxComplexFix(self):
@@ -453,80 +537,70 @@ class Configure(config.base.Configure):
   def checkCxxLibraries(self):
     '''Determines the libraries needed to link using the C or Fortran compiler C++ source code compiled with C++. Result is stored in cxxlibs'''
     skipcxxlibraries = 1
-    self.setCompilers.saveLog()
     body   = '''#include <iostream>\n#include <vector>\nvoid asub(void)\n{std::vector<int> v;\ntry  { throw 20;  }  catch (int e)  { std::cout << "An exception occurred";  }}'''
     oldLibs = ''
     try:
-      if self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C'):
-        self.logWrite(self.setCompilers.restoreLog())
+      with self.setCompilers.loggedProbe():
+        linked = self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C')
+      if linked:
         self.logPrint('C++ libraries are not needed when using C linker')
       else:
         skipcxxlibraries = 0
-        self.logWrite(self.setCompilers.restoreLog())
-        if self.setCompilers.isDarwin(self.log) and config.setCompilers.Configure.isClang(self.getCompiler('C'), self.log):
+        if self.setCompilers.isDarwin(self.log) and self.isCompiler('isClang', 'C'):
           oldLibs = self.setCompilers.LIBS
           self.setCompilers.LIBS = '-lc++ '+self.setCompilers.LIBS
-          self.setCompilers.saveLog()
-          if self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C'):
-            self.setCompilers.LIBS = oldLibs
-            self.logWrite(self.setCompilers.restoreLog())
+          with self.setCompilers.loggedProbe():
+            linked = self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C')
+          self.setCompilers.LIBS = oldLibs
+          if linked:
             self.logPrint('C++ requires -lc++ to link with C compiler', 3, 'compilers')
             self.cxxlibs.append('-lc++')
             skipcxxlibraries = 1
           else:
-            self.logWrite(self.setCompilers.restoreLog())
-            self.setCompilers.LIBS = oldLibs
             self.logPrint('C++ code cannot directly be linked with C linker using -lc++, therefore will determine needed C++ libraries')
             skipcxxlibraries = 0
-        if self.setCompilers.isNEC(self.getCompiler('C'),self.log):
+        if self.isCompiler('isNEC', 'C'):
           oldLibs = self.setCompilers.LIBS
           self.setCompilers.LIBS = '-lnc++ '+self.setCompilers.LIBS
-          self.setCompilers.saveLog()
-          if self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C'):
-            self.setCompilers.LIBS = oldLibs
-            self.logWrite(self.setCompilers.restoreLog())
+          with self.setCompilers.loggedProbe():
+            linked = self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C')
+          self.setCompilers.LIBS = oldLibs
+          if linked:
             self.logPrint('C++ requires -lnc++ to link with C compiler', 3, 'compilers')
             self.cxxlibs.append('-lnc++')
             skipcxxlibraries = 1
           else:
-            self.logWrite(self.setCompilers.restoreLog())
-            self.setCompilers.LIBS = oldLibs
             self.logPrint('C++ code cannot directly be linked with C linker using -lnc++, therefore will determine needed C++ libraries')
             skipcxxlibraries = 0
         if not skipcxxlibraries:
-          self.setCompilers.saveLog()
           oldLibs = self.setCompilers.LIBS
           self.setCompilers.LIBS = '-lstdc++ '+self.setCompilers.LIBS
-          if self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C'):
-            self.setCompilers.LIBS = oldLibs
-            self.logWrite(self.setCompilers.restoreLog())
+          with self.setCompilers.loggedProbe():
+            linked = self.checkCrossLink(body,"int main(int argc,char **args)\n{return 0;}\n",language1='C++',language2='C')
+          self.setCompilers.LIBS = oldLibs
+          if linked:
             self.logPrint('C++ requires -lstdc++ to link with C compiler', 3, 'compilers')
             self.cxxlibs.append('-lstdc++')
             skipcxxlibraries = 1
           else:
-            self.logWrite(self.setCompilers.restoreLog())
-            self.setCompilers.LIBS = oldLibs
             self.logPrint('C++ code cannot directly be linked with C linker using -lstdc++, therefore will determine needed C++ libraries')
             skipcxxlibraries = 0
     except RuntimeError as e:
-      self.logWrite(self.setCompilers.restoreLog())
       self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
       self.logPrint('C++ code cannot directly be linked with C linker, therefore will determine needed C++ libraries')
       skipcxxlibraries = 0
     if skipcxxlibraries and hasattr(self.setCompilers, 'FC'):
-      self.setCompilers.saveLog()
       oldLibs = self.setCompilers.LIBS
-      self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.cxxlibs])+' '+self.setCompilers.LIBS
+      self.setCompilers.LIBS = self.getLibArguments(self.cxxlibs)+' '+self.setCompilers.LIBS
       try:
-        if self.checkCrossLink(body,"     program main\n      print*,'testing'\n      stop\n      end\n",language1='C++',language2='FC'):
-          self.logWrite(self.setCompilers.restoreLog())
+        with self.setCompilers.loggedProbe():
+          linked = self.checkCrossLink(body,"     program main\n      print*,'testing'\n      stop\n      end\n",language1='C++',language2='FC')
+        if linked:
           self.logPrint('Additional C++ libraries are not needed when using FC linker')
         else:
-          self.logWrite(self.setCompilers.restoreLog())
           self.logPrint('Additional C++ libraries are needed when using FC linker')
           skipcxxlibraries = 0
       except RuntimeError as e:
-        self.logWrite(self.setCompilers.restoreLog())
         self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
         self.logPrint('C++ code cannot directly be linked with FC linker, therefore will determine needed C++ libraries')
         skipcxxlibraries = 0
@@ -541,202 +615,45 @@ class Configure(config.base.Configure):
     self.setCompilers.LDFLAGS = oldFlags
     self.popLanguage()
 
-    # Cray: remove libsci link
-    iscray = config.setCompilers.Configure.isCray(self.getCompiler('Cxx'), self.log)
-
-    output = remove_xcode_verbose(output)
-    # PGI: kill anything enclosed in single quotes
-    if output.find('\'') >= 0:
-      if output.count('\'')%2: raise RuntimeError('Mismatched single quotes in C library string')
-      while output.find('\'') >= 0:
-        start = output.index('\'')
-        end   = output.index('\'', start+1)+1
-        output = output.replace(output[start:end], '')
-
-    # The easiest thing to do for xlc output is to replace all the commas
-    # with spaces.  Try to only do that if the output is really from xlc,
-    # since doing that causes problems on other systems.
-    if output.find('XL_CONFIG') >= 0:
-      output = output.replace(',', ' ')
-
-    # Parse output
-    argIter = iter(output.split())
-    cxxlibs = []
-    skipdefaultpaths = self.getSkipDefaultPaths()
-    lflags  = []
-    rpathflags = []
-    try:
-      while 1:
-        arg = next(argIter)
-        self.logPrint( 'Checking arg '+arg, 4, 'compilers')
-
-        # Intel compiler sometimes puts " " around an option like "-lsomething"
-        if arg.startswith('"') and arg.endswith('"'):
-          arg = arg[1:-1]
-        # Intel also puts several options together inside a " " so the last one
-        # has a stray " at the end
-        if arg.endswith('"') and arg[:-1].find('"') == -1:
-          arg = arg[:-1]
-        # Intel 11 has a bogus -long_double option
-        if arg == '-long_double':
-          continue
-
-        # if options of type -L foobar
-        if arg == '-L':
-          lib = next(argIter)
-          self.logPrint('Found -L '+lib, 4, 'compilers')
-          cxxlibs.append('-L'+lib)
-          continue
-        if arg == '-lto_library':
-          lib = next(argIter)
-          self.logPrint('Skipping Apple LLVM linker option -lto_library '+lib)
-          continue
-        # Check for full library name
-        m = re.match(r'^/.*\.a$', arg)
-        if m:
-          if not arg in lflags:
-            lflags.append(arg)
-            self.logPrint('Found full library spec: '+arg, 4, 'compilers')
-            cxxlibs.append(arg)
-          else:
-            self.logPrint('Already in lflags: '+arg, 4, 'compilers')
-          continue
-        # Check for full dylib library name
-        m = re.match(r'^/.*\.dylib$', arg)
-        if m:
-          if not arg in lflags and not arg.endswith('LTO.dylib'):
-            lflags.append(arg)
-            self.logPrint('Found full library spec: '+arg, 4, 'compilers')
-            cxxlibs.append(arg)
-          else:
-            self.logPrint('already in lflags: '+arg, 4, 'compilers')
-          continue
-        # Check for system libraries
-        m = re.match(r'^-l(ang.*|crt[0-9].o|crtbegin.o|c|gcc|gcc_ext(.[0-9]+)*|System|cygwin|xlomp_ser|crt[0-9].[0-9][0-9].[0-9].o)$', arg)
-        if m:
-          self.logPrint('Skipping system library: '+arg, 4, 'compilers')
-          continue
-        # Check for special library arguments
-        m = re.match(r'^-l.*$', arg)
-        if m:
-          if not arg in lflags:
-            if arg == '-lkernel32':
-              continue
-            elif arg == '-lLTO' and self.setCompilers.isDarwin(self.log):
-              self.logPrint('Skipping -lTO')
-              continue
-            elif iscray and (arg == '-lsci_cray_mpi' or arg == '-lsci_cray' or arg == '-lsci_cray_mp'):
-              self.logPrint('Skipping CRAY LIBSCI library: '+arg, 4, 'compilers')
-              continue
-            elif arg in self.clibs:
-              self.logPrint('Library already in C list so skipping in C++', 4, 'compilers')
-              continue
-            else:
-              lflags.append(arg)
-            self.logPrint('Found library: '+arg, 4, 'compilers')
-            cxxlibs.append(arg)
-          else:
-            self.logPrint('Already in flags: '+arg, 4, 'compilers')
-          continue
-        m = re.match(r'^-L.*$', arg)
-        if m:
-          arg = os.path.abspath(arg[2:])
-          if arg in skipdefaultpaths: continue
-          arg = '-L'+arg
-          if not arg in lflags:
-            lflags.append(arg)
-            self.logPrint('Found library directory: '+arg, 4, 'compilers')
-            cxxlibs.append(arg)
-          continue
-        # Check for '-rpath /sharedlibpath/ or -R /sharedlibpath/'
-        if arg == '-rpath' or arg == '-R':
-          lib = next(argIter)
-          if lib.startswith('-') or lib.startswith('@loader_path'): continue # perhaps the path was striped due to quotes?
-          if lib.startswith('"') and lib.endswith('"') and lib.find(' ') == -1: lib = lib[1:-1]
-          lib = os.path.abspath(lib)
-          if lib in skipdefaultpaths: continue
-          if not lib in rpathflags:
-            rpathflags.append(lib)
-            self.logPrint('Found '+arg+' library: '+lib, 4, 'compilers')
-            cxxlibs.append(self.setCompilers.CSharedLinkerFlag+lib)
-          else:
-            self.logPrint('Already in rpathflags, skipping:'+arg, 4, 'compilers')
-          continue
-        # Check for '-R/sharedlibpath/'
-        m = re.match(r'^-R.*$', arg)
-        if m:
-          lib = os.path.abspath(arg[2:])
-          if not lib in rpathflags:
-            rpathflags.append(lib)
-            self.logPrint('Found -R library: '+lib, 4, 'compilers')
-            cxxlibs.append(self.setCompilers.CSharedLinkerFlag+lib)
-          else:
-            self.logPrint('Already in rpathflags, skipping:'+arg, 4, 'compilers')
-          continue
-        self.logPrint('Unknown arg '+arg, 4, 'compilers')
-    except StopIteration:
-      pass
-
-    self.cxxlibs = []
-    for lib in cxxlibs:
-      if not self.setCompilers.staticLibraries and lib.startswith('-L') and not self.setCompilers.CSharedLinkerFlag == '-L':
-        self.cxxlibs.append(self.setCompilers.CSharedLinkerFlag+lib[2:])
-      self.cxxlibs.append(lib)
+    self.cxxlibs = self.parseLinkerVerboseOutput(output, 'Cxx')
 
     self.logPrint('Libraries needed to link Cxx code with another linker: '+str(self.cxxlibs), 3, 'compilers')
 
     self.logPrint('Check that Cxx libraries can be used with C as linker', 4, 'compilers')
-    oldLibs = self.setCompilers.LIBS
-    self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.cxxlibs])+' '+self.setCompilers.LIBS
-    self.setCompilers.saveLog()
-    try:
-      self.setCompilers.checkCompiler('C')
-    except RuntimeError as e:
-      self.logWrite(self.setCompilers.restoreLog())
-      self.logPrint('Cxx libraries cannot directly be used with C as linker', 4, 'compilers')
-      self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
-      raise RuntimeError("Cxx libraries cannot directly be used with C as linker.\n\
+    with self.extraLibraries(self.cxxlibs):
+      try:
+        with self.setCompilers.loggedProbe():
+          self.setCompilers.checkCompiler('C', runFirst = True)
+      except RuntimeError as e:
+        self.logPrint('Cxx libraries cannot directly be used with C as linker', 4, 'compilers')
+        self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
+        raise RuntimeError("Cxx libraries cannot directly be used with C as linker.\n\
 If you don't need the C++ compiler to build external packages or for you application you can run\n\
 ./configure with --with-cxx=0. Otherwise you need a different combination of C and C++ compilers")
-    else:
-      self.logWrite(self.setCompilers.restoreLog())
-    self.setCompilers.LIBS = oldLibs
 
     if hasattr(self.setCompilers, 'FC'):
 
       self.logPrint('Check that Cxx libraries can be used with Fortran as linker', 4, 'compilers')
-      oldLibs = self.setCompilers.LIBS
-      self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.cxxlibs])+' '+self.setCompilers.LIBS
-      self.setCompilers.saveLog()
-      try:
-        self.setCompilers.checkCompiler('FC')
-      except RuntimeError as e:
-        self.logWrite(self.setCompilers.restoreLog())
-        self.logPrint('Cxx libraries cannot directly be used with Fortran as linker', 4, 'compilers')
-        self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
-        raise RuntimeError("Cxx libraries cannot directly be used with Fortran as linker.\n\
+      with self.extraLibraries(self.cxxlibs):
+        try:
+          with self.setCompilers.loggedProbe():
+            self.setCompilers.checkCompiler('FC', runFirst = True)
+        except RuntimeError as e:
+          self.logPrint('Cxx libraries cannot directly be used with Fortran as linker', 4, 'compilers')
+          self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
+          raise RuntimeError("Cxx libraries cannot directly be used with Fortran as linker.\n\
 If you don't need the C++ compiler to build external packages or for you application you can run\n\
 ./configure with --with-cxx=0. If you don't need the Fortran compiler to build external packages\n\
 or for you application you can run ./configure with --with-fc=0.\n\
 Otherwise you need a different combination of C, C++, and Fortran compilers")
-      else:
-        self.logWrite(self.setCompilers.restoreLog())
-      self.setCompilers.LIBS = oldLibs
     return
 
   def mangleFortranFunction(self, name):
-    if self.fortranMangling == 'underscore':
-      if self.fortranManglingDoubleUnderscore and name.find('_') >= 0:
-        return name.lower()+'__'
-      else:
-        return name.lower()+'_'
-    elif self.fortranMangling == 'unchanged':
-      return name.lower()
-    elif self.fortranMangling == 'caps':
-      return name.upper()
-    elif self.fortranMangling == 'stdcall':
-      return name.upper()
-    raise RuntimeError('Unknown Fortran name mangling: '+self.fortranMangling)
+    try:
+      mangler = _FORTRAN_MANGLERS[self.fortranMangling]
+    except KeyError:
+      raise RuntimeError('Unknown Fortran name mangling: '+self.fortranMangling)
+    return mangler(self, name)
 
   def testMangling(self, cfunc, ffunc, clanguage = 'C', extraObjs = []):
     '''Test a certain name mangling'''
@@ -748,23 +665,26 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
       self.logPrint('Cannot compile C function: '+cfunc, 3, 'compilers')
       self.popLanguage()
       return found
-    if not os.path.isfile(self.compilerObj):
+    try:
+      os.replace(self.compilerObj, cobj)
+    except FileNotFoundError:
       self.logPrint('Cannot locate object file: '+os.path.abspath(self.compilerObj), 3, 'compilers')
       self.popLanguage()
       return found
-    os.rename(self.compilerObj, cobj)
     self.popLanguage()
     # Link the test object against a Fortran driver
     self.pushLanguage('FC')
     oldLIBS = self.setCompilers.LIBS
-    self.setCompilers.LIBS = cobj+' '+' '.join([self.libraries.getLibArgument(lib) for lib in self.clibs])+' '+self.setCompilers.LIBS
+    self.setCompilers.LIBS = cobj+' '+self.getLibArguments(self.clibs)+' '+self.setCompilers.LIBS
     if extraObjs:
-      self.setCompilers.LIBS = ' '.join(extraObjs)+' '+' '.join([self.libraries.getLibArgument(lib) for lib in self.clibs])+' '+self.setCompilers.LIBS
+      self.setCompilers.LIBS = ' '.join(extraObjs)+' '+self.getLibArguments(self.clibs)+' '+self.setCompilers.LIBS
     found = self.checkLink(None, ffunc)
     self.setCompilers.LIBS = oldLIBS
     self.popLanguage()
-    if os.path.isfile(cobj):
+    try:
       os.remove(cobj)
+    except FileNotFoundError:
+      pass
     return found
 
   def checkFortranNameMangling(self):
@@ -776,7 +696,11 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
                          'double': ('void d1_chk__(void)', 'void d1_chk__(void){return;}\n', '       call d1_chk()\n')}
     #some compilers silently ignore '__stdcall' directive, so do stdcall test last
     # double test is not done here, so its not listed
-    key_list = ['underscore','unchanged','caps','stdcall']
+    # try the mangling most likely on this platform first, Windows Fortran compilers use caps
+    if self.isCompiler('isWindows', 'FC'):
+      key_list = ['caps','underscore','unchanged','stdcall']
+    else:
+      key_list = ['underscore','unchanged','caps','stdcall']
     for mangler in key_list:
       cfunc = self.manglerFuncs[mangler][1]
       ffunc = self.manglerFuncs[mangler][2]
@@ -799,7 +723,7 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
       self.addDefine('HAVE_FORTRAN_CAPS', 1)
     elif self.fortranMangling == 'stdcall':
       raise RuntimeError('Fortran STDCALL compilers are unsupported!\n')
-    if config.setCompilers.Configure.isGfortran8plus(self.getCompiler('FC'), self.log):
+    if self.isCompiler('isGfortran8plus', 'FC'):
       self.addDefine('FORTRAN_CHARLEN_T', 'size_t')
     else:
       self.addDefine('FORTRAN_CHARLEN_T', 'int')
@@ -840,70 +764,60 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
     if not hasattr(self.setCompilers, 'CC') or not hasattr(self.setCompilers, 'FC'):
       return
     skipfortranlibraries = 1
-    self.setCompilers.saveLog()
-    asub=self.mangleFortranFunction("asub")
-    cbody = "extern void "+asub+"(void);\nint main(int argc,char **args)\n{\n  "+asub+"();\n  return 0;\n}\n";
-    cxxbody = 'extern "C" void '+asub+'(void);\nint main(int argc,char **args)\n{\n  '+asub+'();\n  return 0;\n}\n';
-    self.pushLanguage('FC')
-    if self.checkLink(body='      use mpi\n      call MPI_Allreduce()\n'):
-      fbody = "      subroutine asub()\n      use mpi\n      print*,'testing'\n      call MPI_Allreduce()\n      return\n      end\n"
-    elif self.checkLink(includes='#include <mpif.h>',body='      call MPI_Allreduce()\n'):
-      fbody = "      subroutine asub()\n      print*,'testing'\n      call MPI_Allreduce()\n      return\n      end\n"
-    else:
-      fbody = "      subroutine asub()\n      print*,'testing'\n      return\n      end\n"
-    self.popLanguage()
-    iscray = config.setCompilers.Configure.isCray(self.getCompiler('FC'), self.log)
-    isintel = config.setCompilers.Configure.isIntel(self.getCompiler('C'), self.log)
+    with self.setCompilers.loggedProbe():
+      asub=self.mangleFortranFunction("asub")
+      cbody = "extern void "+asub+"(void);\nint main(int argc,char **args)\n{\n  "+asub+"();\n  return 0;\n}\n";
+      cxxbody = 'extern "C" void '+asub+'(void);\nint main(int argc,char **args)\n{\n  '+asub+'();\n  return 0;\n}\n';
+      self.pushLanguage('FC')
+      if self.checkLink(body='      use mpi\n      call MPI_Allreduce()\n'):
+        fbody = "      subroutine asub()\n      use mpi\n      print*,'testing'\n      call MPI_Allreduce()\n      return\n      end\n"
+      elif self.checkLink(includes='#include <mpif.h>',body='      call MPI_Allreduce()\n'):
+        fbody = "      subroutine asub()\n      print*,'testing'\n      call MPI_Allreduce()\n      return\n      end\n"
+      else:
+        fbody = "      subroutine asub()\n      print*,'testing'\n      return\n      end\n"
+      self.popLanguage()
+      iscray = self.isCompiler('isCray', 'FC')
+      isintel = self.isCompiler('isIntel', 'C')
     try:
-      if self.checkCrossLink(fbody,cbody,language1='FC',language2='C'):
-        self.logWrite(self.setCompilers.restoreLog())
+      with self.setCompilers.loggedProbe():
+        linked = self.checkCrossLink(fbody,cbody,language1='FC',language2='C')
+      if linked:
         self.logPrint('Fortran libraries are not needed when using C linker')
       else:
         skipfortranlibraries = 0
-        self.logWrite(self.setCompilers.restoreLog())
         oldLibs = self.setCompilers.LIBS
         testlibs = ['-lgfortran']
         if iscray: testlibs.append('-lmpifort_cray')
         if isintel: testlibs.append('-fortlib')
         for testlib in testlibs:
           self.setCompilers.LIBS = testlib+' '+self.setCompilers.LIBS
-          self.setCompilers.saveLog()
-          if self.checkCrossLink(fbody,cbody,language1='FC',language2='C'):
-            self.logWrite(self.setCompilers.restoreLog())
+          with self.setCompilers.loggedProbe():
+            linked = self.checkCrossLink(fbody,cbody,language1='FC',language2='C')
+          self.setCompilers.LIBS = oldLibs
+          if linked:
             self.logPrint('Fortran requires '+testlib+' to link with C compiler', 3, 'compilers')
-            self.setCompilers.LIBS = oldLibs
             self.flibs.append(testlib)
             skipfortranlibraries = 1
             break
           else:
-            self.logWrite(self.setCompilers.restoreLog())
-            self.setCompilers.LIBS = oldLibs
             skipfortranlibraries = 0
         if not skipfortranlibraries:
           self.logPrint('Fortran code cannot directly be linked with C linker, therefore will determine needed Fortran libraries')
     except RuntimeError as e:
-      self.logWrite(self.setCompilers.restoreLog())
       self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
       self.logPrint('Fortran code cannot directly be linked with C linker, therefore will determine needed Fortran libraries')
       skipfortranlibraries = 0
     if skipfortranlibraries and hasattr(self.setCompilers, 'CXX'):
-      self.setCompilers.saveLog()
-      oldLibs = self.setCompilers.LIBS
       try:
-        self.setCompilers.LIBS =  ' '.join([self.libraries.getLibArgument(lib) for lib in self.flibs]) + ' ' + self.setCompilers.LIBS
-        if self.checkCrossLink(fbody,cxxbody,language1='FC',language2='C++'):
-          self.logWrite(self.setCompilers.restoreLog())
-          self.setCompilers.LIBS = oldLibs
+        with self.setCompilers.loggedProbe(), self.extraLibraries(self.flibs):
+          linked = self.checkCrossLink(fbody,cxxbody,language1='FC',language2='C++')
+        if linked:
           self.logPrint('Additional Fortran libraries are not needed when using C++ linker')
         else:
-          self.logWrite(self.setCompilers.restoreLog())
-          self.setCompilers.LIBS = oldLibs
           self.logPrint('Fortran code cannot directly be linked with C++ linker, therefore will determine needed Fortran libraries')
           skipfortranlibraries = 0
       except RuntimeError as e:
-        self.logWrite(self.setCompilers.restoreLog())
         self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
-        self.setCompilers.LIBS = oldLibs
         self.logPrint('Fortran code cannot directly be linked with CXX linker, therefore will determine needed Fortran libraries')
         skipfortranlibraries = 0
 
@@ -918,11 +832,10 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
     self.setCompilers.LDFLAGS = oldFlags
     self.popLanguage()
 
-    output = remove_xcode_verbose(output)
-    # replace \CR that ifc puts in each line of output
-    output = output.replace('\\\n', '')
+    # remove the Xcode warnings and the \CR that ifc puts in each line of output in one pass
+    output = _RE_XCODE_VERBOSE_CR.sub('', output)
 
-    if output.lower().find('absoft') >= 0:
+    if _RE_ABSOFT.search(output):
       loc = output.find(' -lf90math')
       if loc == -1: loc = output.find(' -lf77math')
       if loc >= -1:
@@ -932,32 +845,30 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
     # PGI Fortran compiler uses PETSC_HAVE_F90_2PTR_ARG which is incompatible with
     # certain PETSc example uses of Fortran (like passing classes) hence we need to define
     # HAVE_PGF90_COMPILER so those examples are not run
-    if output.find(' -lpgf90') >= 0 and output.find(' -lkernel32') >= 0:
+    if ' -lpgf90' in output and ' -lkernel32' in output:
       loc  = output.find(' -lpgf90')
       loc2 = output.find(' -lpgf90rtl -lpgftnrtl')
       if loc2 >= -1:
         output = output[0:loc] + ' -lpgf90rtl -lpgftnrtl' + output[loc:]
-    elif output.find(' -lpgf90rtl -lpgftnrtl') >= 0:
+    elif ' -lpgf90rtl -lpgftnrtl' in output:
       # somehow doing this hacky thing appears to get rid of error with undefined __hpf_exit
       self.logPrint('Adding -lpgftnrtl before -lpgf90rtl in librarylist')
       output = output.replace(' -lpgf90rtl -lpgftnrtl',' -lpgftnrtl -lpgf90rtl -lpgftnrtl')
 
     # PGI: kill anything enclosed in single quotes
-    if output.find('\'') >= 0:
-      if output.count('\'')%2: raise RuntimeError('Mismatched single quotes in Fortran library string')
-      while output.find('\'') >= 0:
-        start = output.index('\'')
-        end   = output.index('\'', start+1)+1
-        output = output.replace(output[start:end], '')
+    quotes = output.count('\'')
+    if quotes%2: raise RuntimeError('Mismatched single quotes in Fortran library string')
+    elif quotes:
+      output = _RE_QUOTED.sub('', output)
 
     # The easiest thing to do for xlf output is to replace all the commas
     # with spaces.  Try to only do that if the output is really from xlf,
     # since doing that causes problems on other systems.
-    if output.find('XL_CONFIG') >= 0:
+    if 'XL_CONFIG' in output:
       output = output.replace(',', ' ')
     # We are only supposed to find LD_RUN_PATH on Solaris systems
     # and the run path should be absolute
-    ldRunPath = re.findall(r'^.*LD_RUN_PATH *= *([^ ]*).*', output)
+    ldRunPath = _RE_LD_RUN_PATH.findall(output)
     if ldRunPath: ldRunPath = ldRunPath[0]
     if ldRunPath and ldRunPath[0] == '/':
       if self.isGCC:
@@ -968,17 +879,27 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
       ldRunPath = []
 
     # Parse output
-    argIter = iter(output.split())
+    # tokens are produced as the loop consumes them rather than splitting the whole output up front
+    argIter = (m.group() for m in _RE_TOKEN.finditer(output))
     fincs   = []
     flibs   = []
     skipdefaultpaths = self.getSkipDefaultPaths()
     fmainlibs = []
-    lflags  = []
-    rpathflags = []
+    lflags  = set()
+    rpathflags = set()
+    clibs = frozenset(self.clibs)
+    isdirs = {}
+    # properties of the system that do not change while parsing
+    isdarwin = self.setCompilers.isDarwin(self.log)
+    iscygwin = config.setCompilers.Configure.isCygwin(self.log)
+    isgcc = self.isGCC
+    cSharedLinkerFlag = self.setCompilers.CSharedLinkerFlag
+    # collect the per argument messages and write them to the log at once
+    logLines = []
     try:
       while 1:
         arg = next(argIter)
-        self.logPrint( 'Checking arg '+arg, 4, 'compilers')
+        logLines.append('Checking arg '+arg)
         # Intel compiler sometimes puts " " around an option like "-lsomething"
         if arg.startswith('"') and arg.endswith('"'):
           arg = arg[1:-1]
@@ -987,147 +908,160 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
         if arg.endswith('"') and arg[:-1].find('"') == -1:
           arg = arg[:-1]
 
-        if arg == '-lto_library':
-          lib = next(argIter)
-          self.logPrint('Skipping Apple LLVM linker option -lto_library '+lib)
-          continue
-        # Check for full library name
-        m = re.match(r'^/.*\.a$', arg)
-        if m:
-          if not arg in lflags:
-            lflags.append(arg)
-            self.logPrint('Found full library spec: '+arg, 4, 'compilers')
-#            # check for Nag Fortran library that must be handled as static because shared version does not have all the symbols
-            base = os.path.basename(arg)
-            m = re.match(r'libf[1-9][0-9]rts.a', base)
-            if m:
-              self.logPrint('Detected Nag Fortran compiler library; preserving as static library: '+arg, 4, 'compilers')
-              flibs.append(arg)
-              flibs.append('-Wl,-Bstatic')
-              flibs.append(arg)
-              flibs.append('-Wl,-Bdynamic')
-            else:
-              flibs.append(arg)
-          else:
-            self.logPrint('already in lflags: '+arg, 4, 'compilers')
-          continue
-        # Check for full dylib library name
-        m = re.match(r'^/.*\.dylib$', arg)
-        if m:
-          if not arg.endswith('LTO.dylib') and not arg in lflags:
-            lflags.append(arg)
-            self.logPrint('Found full library spec: '+arg, 4, 'compilers')
-            flibs.append(arg)
-          else:
-            self.logPrint('already in lflags: '+arg, 4, 'compilers')
-          continue
-        # prevent false positives for include with pathscalr
-        if re.match(r'^-INTERNAL.*$', arg): continue
-        # Check for special include argument
-        # AIX does this for MPI and perhaps other things
-        m = re.match(r'^-I.*$', arg)
-        if m:
-          inc = arg.replace('-I','',1)
-          self.logPrint('Found include directory: '+inc, 4, 'compilers')
-          fincs.append(inc)
-          continue
-        # Check for ???
-        m = re.match(r'^-bI:.*$', arg)
-        if m:
-          if not arg in lflags:
-            if self.isGCC:
-              lflags.append('-Xlinker')
-            lflags.append(arg)
-            self.logPrint('Found binary include: '+arg, 4, 'compilers')
-            flibs.append(arg)
-          else:
-            self.logPrint('Already in lflags so skipping: '+arg, 4, 'compilers')
-          continue
-        # Check for system libraries
-        m = re.match(r'^-l(ang.*|crt[0-9].o|crtbegin.o|c|gcc|gcc_ext(.[0-9]+)*|System|cygwin|xlomp_ser|crt[0-9].[0-9][0-9].[0-9].o)$', arg)
-        if m:
-          self.logPrint('Found system library therefore skipping: '+arg, 4, 'compilers')
-          continue
-        # Check for canonical library argument
-        m = re.match(r'^-[lL]$', arg)
-        if m:
-          lib = arg+next(argIter)
-          self.logPrint('Found canonical library: '+lib, 4, 'compilers')
-          if not lib == '-LLTO' or not self.setCompilers.isDarwin(self.log):
+        # Dispatch on the leading characters so only the patterns that can match are tried
+        s2 = arg[:2]
+        if s2 == '-l':
+          if arg == '-lto_library':
+            lib = next(argIter)
+            logLines.append('Skipping Apple LLVM linker option -lto_library '+lib)
+            continue
+          # Check for system libraries
+          m = _RE_SYSLIB.match(arg)
+          if m:
+            logLines.append('Found system library therefore skipping: '+arg)
+            continue
+          # Check for canonical library argument
+          if arg == '-l':
+            lib = arg+next(argIter)
+            logLines.append('Found canonical library: '+lib)
             flibs.append(lib)
-          continue
-        # intel windows compilers can use -libpath argument
-        if arg.find('-libpath:')>=0:
-          self.logPrint('Skipping win32 ifort option: '+arg)
-          continue
-        # Check for special library arguments
-        m = re.match(r'^-l.*$', arg)
-        if m:
+            continue
+          # intel windows compilers can use -libpath argument
+          if arg.find('-libpath:')>=0:
+            logLines.append('Skipping win32 ifort option: '+arg)
+            continue
+          # Check for special library arguments
           # HP Fortran prints these libraries in a very strange way
           if arg == '-l:libU77.a':  arg = '-lU77'
           if arg == '-l:libF90.a':  arg = '-lF90'
           if arg == '-l:libIO77.a': arg = '-lIO77'
-          if not arg in lflags:
+          if arg not in lflags:
             if arg == '-lkernel32':
               continue
             elif arg == '-lgfortranbegin':
               fmainlibs.append(arg)
               continue
-            elif arg == '-lfrtbegin' and not config.setCompilers.Configure.isCygwin(self.log):
+            elif arg == '-lfrtbegin' and not iscygwin:
               fmainlibs.append(arg)
               continue
-            elif arg == '-lLTO' and self.setCompilers.isDarwin(self.log):
-              self.logPrint('Skipping -lTO')
+            elif arg == '-lLTO' and isdarwin:
+              logLines.append('Skipping -lTO')
             elif iscray and (arg == '-lsci_cray_mpi' or arg == '-lsci_cray' or arg == '-lsci_cray_mp'):
-              self.logPrint('Skipping CRAY LIBSCI library: '+arg, 4, 'compilers')
+              logLines.append('Skipping CRAY LIBSCI library: '+arg)
               continue
-            elif arg in self.clibs:
-              self.logPrint('Library already in C list so skipping in Fortran', 4, 'compilers')
+            elif arg in clibs:
+              logLines.append('Library already in C list so skipping in Fortran')
               continue
             else:
-              lflags.append(arg)
-            self.logPrint('Found library: '+arg, 4, 'compilers')
+              lflags.add(arg)
+            logLines.append('Found library: '+arg)
             flibs.append(arg)
           else:
-            self.logPrint('Already in lflags: '+arg, 4, 'compilers')
+            logLines.append('Already in lflags: '+arg)
           continue
-        m = re.match(r'^-L.*$', arg)
-        if m:
-          arg = os.path.abspath(arg[2:])
+        elif s2 == '-L':
+          # Check for canonical library argument
+          if arg == '-L':
+            lib = arg+next(argIter)
+            logLines.append('Found canonical library: '+lib)
+            if not lib == '-LLTO' or not isdarwin:
+              flibs.append(lib)
+            continue
+          # intel windows compilers can use -libpath argument
+          if arg.find('-libpath:')>=0:
+            logLines.append('Skipping win32 ifort option: '+arg)
+            continue
+          if arg[2:] in skipdefaultpaths: continue # skip the normalization for the common default paths
+          arg = abspath(arg[2:])
           if arg in skipdefaultpaths: continue
           arg = '-L'+arg
-          if not arg in lflags:
-            lflags.append(arg)
-            self.logPrint('Found library directory: '+arg, 4, 'compilers')
+          if arg not in lflags:
+            lflags.add(arg)
+            logLines.append('Found library directory: '+arg)
+            flibs.append(arg)
+          else:
+            logLines.append('Already in lflags so skipping: '+arg)
+          continue
+        elif s2 == '-I':
+          # prevent false positives for include with pathscalr
+          if arg.startswith('-INTERNAL'): continue
+          # Check for special include argument
+          # AIX does this for MPI and perhaps other things
+          inc = arg[2:]
+          logLines.append('Found include directory: '+inc)
+          fincs.append(inc)
+          continue
+        elif s2[:1] == '/':
+          # Check for full library name
+          if arg.endswith('.a'):
+            if arg not in lflags:
+              lflags.add(arg)
+              logLines.append('Found full library spec: '+arg)
+#              # check for Nag Fortran library that must be handled as static because shared version does not have all the symbols
+              if _RE_NAGLIB.search(arg):
+                logLines.append('Detected Nag Fortran compiler library; preserving as static library: '+arg)
+                flibs.append(arg)
+                flibs.append('-Wl,-Bstatic')
+                flibs.append(arg)
+                flibs.append('-Wl,-Bdynamic')
+              else:
+                flibs.append(arg)
+            else:
+              logLines.append('already in lflags: '+arg)
+            continue
+          # Check for full dylib library name
+          if arg.endswith('.dylib'):
+            if not arg.endswith('LTO.dylib') and arg not in lflags:
+              lflags.add(arg)
+              logLines.append('Found full library spec: '+arg)
+              flibs.append(arg)
+            else:
+              logLines.append('already in lflags: '+arg)
+            continue
+        # Check for ???
+        elif arg.startswith('-bI:'):
+          if arg not in lflags:
+            if isgcc:
+              lflags.add('-Xlinker')
+            lflags.add(arg)
+            logLines.append('Found binary include: '+arg)
             flibs.append(arg)
           else:
-            self.logPrint('Already in lflags so skipping: '+arg, 4, 'compilers')
+            logLines.append('Already in lflags so skipping: '+arg)
           continue
         # Check for '-rpath /sharedlibpath/ or -R /sharedlibpath/'
-        if arg == '-rpath' or arg == '-R':
+        elif arg == '-rpath' or arg == '-R':
           lib = next(argIter)
           if lib == '\\': lib = next(argIter)
           if lib.startswith('-') or lib.startswith('@loader_path'): continue # perhaps the path was striped due to quotes?
           if lib.startswith('"') and lib.endswith('"') and lib.find(' ') == -1: lib = lib[1:-1]
-          lib = os.path.abspath(lib)
           if lib in skipdefaultpaths: continue
-          if not lib in rpathflags:
-            rpathflags.append(lib)
-            self.logPrint('Found '+arg+' library: '+lib, 4, 'compilers')
-            flibs.append(self.setCompilers.CSharedLinkerFlag+lib)
+          lib = abspath(lib)
+          if lib in skipdefaultpaths: continue
+          if lib not in rpathflags:
+            rpathflags.add(lib)
+            logLines.append('Found '+arg+' library: '+lib)
+            flibs.append(cSharedLinkerFlag+lib)
           else:
-            self.logPrint('Already in rpathflags so skipping: '+arg, 4, 'compilers')
+            logLines.append('Already in rpathflags so skipping: '+arg)
           continue
         # Check for '-R/sharedlibpath/'
-        m = re.match(r'^-R.*$', arg)
-        if m:
-          lib = os.path.abspath(arg[2:])
-          if not lib in rpathflags:
-            rpathflags.append(lib)
-            self.logPrint('Found -R library: '+lib, 4, 'compilers')
-            flibs.append(self.setCompilers.CSharedLinkerFlag+lib)
+        elif s2 == '-R':
+          # intel windows compilers can use -libpath argument
+          if arg.find('-libpath:')>=0:
+            logLines.append('Skipping win32 ifort option: '+arg)
+            continue
+          lib = abspath(arg[2:])
+          if lib not in rpathflags:
+            rpathflags.add(lib)
+            logLines.append('Found -R library: '+lib)
+            flibs.append(cSharedLinkerFlag+lib)
           else:
-            self.logPrint('Already in rpathflags so skipping: '+arg, 4, 'compilers')
+            logLines.append('Already in rpathflags so skipping: '+arg)
+          continue
+        # intel windows compilers can use -libpath argument
+        if arg.find('-libpath:')>=0:
+          logLines.append('Skipping win32 ifort option: '+arg)
           continue
         if arg.startswith('-zallextract') or arg.startswith('-zdefaultextract') or arg.startswith('-zweakextract'):
           self.logWrite( 'Found Solaris -z option: '+arg+'\n')
@@ -1144,49 +1078,55 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
           for lib in libs.split(':'):
             #solaris gnu g77 has this extra P, here, not sure why it means
             if lib.startswith('P,'):lib = lib[2:]
-            self.logPrint('Handling -Y option: '+lib, 4, 'compilers')
-            lib1 = os.path.abspath(lib)
+            logLines.append('Handling -Y option: '+lib)
+            if lib in skipdefaultpaths: continue
+            lib1 = abspath(lib)
             if lib1 in skipdefaultpaths: continue
             lib1 = '-L'+lib1
             flibs.append(lib1)
           continue
         if arg.startswith('COMPILER_PATH=') or arg.startswith('LIBRARY_PATH='):
-          self.logPrint('Skipping arg '+arg, 4, 'compilers')
+          logLines.append('Skipping arg '+arg)
           continue
         # HPUX lists a bunch of library directories separated by :
         if arg.find(':') >=0:
           founddir = 0
           for l in arg.split(':'):
-            if os.path.isdir(l):
-              lib1 = os.path.abspath(l)
+            if not l in isdirs: isdirs[l] = os.path.isdir(l)
+            if isdirs[l]:
+              lib1 = abspath(l)
               if lib1 in skipdefaultpaths: continue
               lib1 = '-L'+lib1
-              if not arg in lflags:
+              if arg not in lflags:
                 flibs.append(lib1)
-                lflags.append(lib1)
-                self.logPrint('Handling HPUX list of directories: '+l, 4, 'compilers')
+                lflags.add(lib1)
+                logLines.append('Handling HPUX list of directories: '+l)
                 founddir = 1
           if founddir:
             continue
         # needed with NCC/NFORT 3.2.0 on NEC and by the FORTRAN NAG Compiler (f61init and quickfit) https://www.nag.com/nagware/np/r62_doc/manual/compiler_11_1.html
         if arg.find('f61init.o')>=0 or arg.find('quickfit.o')>=0 or arg.find('f90_init.o')>=0 or arg.find('nousemmap.o')>=0 or arg.find('async_noio.o')>=0:
           flibs.append(arg)
-          self.logPrint('Found '+arg+' in argument, adding it')
+          logLines.append('Found '+arg+' in argument, adding it')
           continue
         # gcc+pgf90 might require pgi.dl
         if arg.find('pgi.ld')>=0:
           flibs.append(arg)
-          self.logPrint('Found strange PGI file ending with .ld, adding it')
+          logLines.append('Found strange PGI file ending with .ld, adding it')
           continue
-        self.logPrint('Unknown arg '+arg, 4, 'compilers')
+        logLines.append('Unknown arg '+arg)
     except StopIteration:
       pass
+    if logLines:
+      self.logPrint('\n'.join(logLines), 4, 'compilers')
 
     self.fincs = fincs
     self.flibs = []
+    sharedLinkerFlag = self.setCompilers.FCSharedLinkerFlag
+    rewrite = not self.setCompilers.staticLibraries and not sharedLinkerFlag == '-L'
     for lib in flibs:
-      if not self.setCompilers.staticLibraries and lib.startswith('-L') and not self.setCompilers.FCSharedLinkerFlag == '-L':
-        self.flibs.append(self.setCompilers.FCSharedLinkerFlag+lib[2:])
+      if rewrite and lib.startswith('-L'):
+        self.flibs.append(sharedLinkerFlag+lib[2:])
       self.flibs.append(lib)
     self.fmainlibs = fmainlibs
     # Append run path
@@ -1208,93 +1148,86 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
     self.logPrint('Libraries needed to link Fortran main with the C linker: '+str(self.fmainlibs), 3, 'compilers')
 
     self.logPrint('Check that Fortran libraries can be used with Fortran as the linker', 4, 'compilers')
-    oldLibs = self.setCompilers.LIBS
-    self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.flibs])+' '+self.setCompilers.LIBS
-    try:
-      self.setCompilers.checkCompiler('FC')
-    except RuntimeError as e:
-      self.logPrint('Fortran libraries cannot directly be used with Fortran as the linker, try with -Wl,-z -Wl,muldefs', 4, 'compilers')
-      self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
+    with self.extraLibraries(self.flibs):
       try:
-        self.setCompilers.pushLanguage('FC')
-        # this is needed with NEC Fortran compiler
-        self.setCompilers.addLinkerFlag('-Wl,-z -Wl,muldefs')
-        self.setCompilers.popLanguage()
+        self.setCompilers.checkCompiler('FC', runFirst = True)
       except RuntimeError as e:
-        self.logPrint('Fortran libraries still cannot directly be used with Fortran as the linker', 4, 'compilers')
+        self.logPrint('Fortran libraries cannot directly be used with Fortran as the linker, try with -Wl,-z -Wl,muldefs', 4, 'compilers')
         self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
-        raise RuntimeError('Fortran libraries cannot be used with Fortran as linker')
-    self.setCompilers.LIBS = oldLibs
+        try:
+          self.setCompilers.pushLanguage('FC')
+          # this is needed with NEC Fortran compiler
+          self.setCompilers.addLinkerFlag('-Wl,-z -Wl,muldefs')
+          self.setCompilers.popLanguage()
+        except RuntimeError as e:
+          self.logPrint('Fortran libraries still cannot directly be used with Fortran as the linker', 4, 'compilers')
+          self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
+          raise RuntimeError('Fortran libraries cannot be used with Fortran as linker')
 
     self.logPrint('Check that Fortran libraries can be used with C as the linker', 4, 'compilers')
     oldLibs = self.setCompilers.LIBS
-    self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.flibs])+' '+self.setCompilers.LIBS
-    self.setCompilers.saveLog()
+    self.setCompilers.LIBS = self.getLibArguments(self.flibs)+' '+self.setCompilers.LIBS
     try:
-      self.setCompilers.checkCompiler('C')
+      with self.setCompilers.loggedProbe():
+        self.setCompilers.checkCompiler('C', runFirst = True)
     except RuntimeError as e:
-      self.logWrite(self.setCompilers.restoreLog())
       self.logPrint('Fortran libraries cannot directly be used with C as the linker, try without -lcrt2.o', 4, 'compilers')
       self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
       # try removing this one
       if '-lcrt2.o' in self.flibs: self.flibs.remove('-lcrt2.o')
-      self.setCompilers.LIBS = oldLibs+' '+' '.join([self.libraries.getLibArgument(lib) for lib in self.flibs])
-      self.setCompilers.saveLog()
+      self.setCompilers.LIBS = oldLibs+' '+self.getLibArguments(self.flibs)
       try:
-        self.setCompilers.checkCompiler('C')
+        with self.setCompilers.loggedProbe():
+          self.setCompilers.checkCompiler('C')
       except RuntimeError as e:
-        self.logWrite(self.setCompilers.restoreLog())
         self.logPrint('Fortran libraries still cannot directly be used with C as the linker, try without pgi.ld files', 4, 'compilers')
         self.logPrint('Error message from compiling {'+str(e)+'}', 4, 'compilers')
         tmpflibs = self.flibs
         for lib in tmpflibs:
           if lib.find('pgi.ld')>=0:
             self.flibs.remove(lib)
-        self.setCompilers.LIBS = oldLibs+' '+' '.join([self.libraries.getLibArgument(lib) for lib in self.flibs])
-        self.setCompilers.saveLog()
+        self.setCompilers.LIBS = oldLibs+' '+self.getLibArguments(self.flibs)
         try:
-          self.setCompilers.checkCompiler('C')
+          with self.setCompilers.loggedProbe():
+            self.setCompilers.checkCompiler('C')
         except:
-          self.logWrite(self.setCompilers.restoreLog())
           self.logPrint(str(e), 4, 'compilers')
           raise RuntimeError('Fortran libraries cannot be used with C as linker')
-      else:
-        self.logWrite(self.setCompilers.restoreLog())
-    else:
-      self.logWrite(self.setCompilers.restoreLog())
 
     if hasattr(self.setCompilers, 'CXX'):
       self.logPrint('Check that Fortran libraries can be used with C++ as linker', 4, 'compilers')
-      self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.flibs])+' '+oldLibs
-      self.setCompilers.saveLog()
+      self.setCompilers.LIBS = self.getLibArguments(self.flibs)+' '+oldLibs
       try:
-        self.setCompilers.checkCompiler('Cxx')
+        with self.setCompilers.loggedProbe():
+          self.setCompilers.checkCompiler('Cxx', runFirst = True)
         self.logPrint('Fortran libraries can be used from C++', 4, 'compilers')
       except RuntimeError as e:
-        self.logWrite(self.setCompilers.restoreLog())
         self.logPrint(str(e), 4, 'compilers')
         # try removing this one causes grief with gnu g++ and Intel Fortran
-        if '-lintrins' in self.flibs: self.flibs.remove('-lintrins')
-        self.setCompilers.LIBS = oldLibs+' '+' '.join([self.libraries.getLibArgument(lib) for lib in self.flibs])
-        self.setCompilers.saveLog()
-        try:
-          self.setCompilers.checkCompiler('Cxx')
-        except RuntimeError as e:
-          self.logWrite(self.setCompilers.restoreLog())
-          self.logPrint(str(e), 4, 'compilers')
-          if str(e).find('INTELf90_dclock') >= 0:
-            self.logPrint('Intel 7.1 Fortran compiler cannot be used with g++ 3.2!', 2, 'compilers')
-        else:
-           self.logWrite(self.setCompilers.restoreLog())
+        # the second link only refines the diagnostic, so skip it when flibs is unchanged
+        if '-lintrins' in self.flibs:
+          self.flibs.remove('-lintrins')
+          self.setCompilers.LIBS = oldLibs+' '+self.getLibArguments(self.flibs)
+          try:
+            with self.setCompilers.loggedProbe():
+              self.setCompilers.checkCompiler('Cxx')
+          except RuntimeError as e:
+            self.logPrint(str(e), 4, 'compilers')
+            if str(e).find('INTELf90_dclock') >= 0:
+              self.logPrint('Intel 7.1 Fortran compiler cannot be used with g++ 3.2!', 2, 'compilers')
+        elif str(e).find('INTELf90_dclock') >= 0:
+          self.logPrint('Intel 7.1 Fortran compiler cannot be used with g++ 3.2!', 2, 'compilers')
         raise RuntimeError('Fortran libraries cannot be used with C++ as linker.\n Run with --with-fc=0 or --with-cxx=0')
-      else:
-        self.logWrite(self.setCompilers.restoreLog())
 
     self.setCompilers.LIBS = oldLibs
     return
 
   def checkFortranLinkingCxx(self):
     '''Check that Fortran can link C++ libraries'''
+    # a Fortran linked extern "C" function in a C++ object is known to work with the GNU compilers
+    if self.fortranMangling == 'underscore' and self.isGCXX and self.isCompiler('isGNU', 'FC'):
+      self.logPrint('Fortran can link C++ functions since both compilers are GNU compilers', 3, 'compilers')
+      return
     link = 0
     cinc, cfunc, ffunc = self.manglerFuncs[self.fortranMangling]
     cinc = 'extern "C" '+cinc+'\n'
@@ -1305,10 +1238,11 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
     if not self.checkCompile(cinc+cxxCode, None, cleanup = 0):
       self.logPrint('Cannot compile Cxx function: '+cfunc, 3, 'compilers')
       raise RuntimeError('Fortran could not successfully link C++ objects')
-    if not os.path.isfile(self.compilerObj):
+    try:
+      os.replace(self.compilerObj, cxxobj)
+    except FileNotFoundError:
       self.logPrint('Cannot locate object file: '+os.path.abspath(self.compilerObj), 3, 'compilers')
       raise RuntimeError('Fortran could not successfully link C++ objects')
-    os.rename(self.compilerObj, cxxobj)
     self.popLanguage()
 
     if self.testMangling(cinc+cfunc, ffunc, 'Cxx', extraObjs = [cxxobj]):
@@ -1316,14 +1250,16 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
       link = 1
     else:
       oldLibs = self.setCompilers.LIBS
-      self.setCompilers.LIBS = ' '.join([self.libraries.getLibArgument(lib) for lib in self.cxxlibs])+' '+self.setCompilers.LIBS
+      self.setCompilers.LIBS = self.getLibArguments(self.cxxlibs)+' '+self.setCompilers.LIBS
       if self.testMangling(cinc+cfunc, ffunc, 'Cxx', extraObjs = [cxxobj]):
         self.logPrint('Fortran can link C++ functions using the C++ compiler libraries', 3, 'compilers')
         link = 1
       else:
         self.setCompilers.LIBS = oldLibs
-    if os.path.isfile(cxxobj):
+    try:
       os.remove(cxxobj)
+    except FileNotFoundError:
+      pass
     if not link:
       raise RuntimeError('Fortran could not successfully link C++ objects with Fortran as linker')
     return
@@ -1347,34 +1283,41 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
       languages.append('SYCL')
     for language in languages:
       self.generateDependencies[language] = 0
-      self.setCompilers.saveLog()
-      self.setCompilers.pushLanguage(language)
-      for testFlag in ['-MMD -MP', # GCC, Intel, Clang, Pathscale
-                       '-MMD',     # PGI
-                       '-xMMD',    # Sun
-                       '-qmakedep=gcc', # xlc
-                       '-MD',
-                       # Cray only supports -M, which writes to stdout
-                     ]:
-        try:
-          self.logPrint('Trying '+language+' compiler flag '+testFlag)
-          if self.setCompilers.checkCompilerFlag(testFlag, compilerOnly = 1):
-            depFilename = os.path.splitext(self.setCompilers.compilerObj)[0]+'.d'
-            if os.path.isfile(depFilename):
-              os.remove(depFilename)
+      testFlags = ['-MMD -MP', # GCC, Intel, Clang, Pathscale
+                   '-MMD',     # PGI
+                   '-xMMD',    # Sun
+                   '-qmakedep=gcc', # xlc
+                   '-MD',
+                   # Cray only supports -M, which writes to stdout
+                 ]
+      # the GNU compilers accept the first flag, for the others try the flag of the compiler family first
+      # (configure() sets isGCC and isGCXX only after these checks have run, so ask isCompiler() directly)
+      if language in ('C', 'Cxx') and not self.isCompiler('isGNU', language):
+        for check, testFlag in [('isPGI', '-MMD'), ('isSun', '-xMMD'), ('isIBM', '-qmakedep=gcc')]:
+          if self.isCompiler(check, language):
+            testFlags.remove(testFlag)
+            testFlags.insert(0, testFlag)
+            break
+      with self.setCompilers.loggedProbe(), self.setCompilers.Language(language):
+        for testFlag in testFlags:
+          try:
+            self.logPrint('Trying '+language+' compiler flag '+testFlag)
+            if self.setCompilers.checkCompilerFlag(testFlag, compilerOnly = 1):
+              depFilename = os.path.splitext(self.setCompilers.compilerObj)[0]+'.d'
+              try:
+                os.remove(depFilename)
+              except FileNotFoundError:
+                self.logPrint('Rejected '+language+' compiler flag '+testFlag+' because no dependency file ('+depFilename+') was generated')
+                continue
               #self.setCompilers.insertCompilerFlag(testFlag, compilerOnly = 1)
               self.framework.addMakeMacro(language.upper()+'_DEPFLAGS',testFlag)
               self.dependenciesGenerationFlag[language] = testFlag
               self.generateDependencies[language]       = 1
               break
             else:
-              self.logPrint('Rejected '+language+' compiler flag '+testFlag+' because no dependency file ('+depFilename+') was generated')
-          else:
+              self.logPrint('Rejected '+language+' compiler flag '+testFlag)
+          except RuntimeError:
             self.logPrint('Rejected '+language+' compiler flag '+testFlag)
-        except RuntimeError:
-          self.logPrint('Rejected '+language+' compiler flag '+testFlag)
-      self.setCompilers.popLanguage()
-      self.logWrite(self.setCompilers.restoreLog())
     return
 
   def checkLinux(self):
@@ -1404,16 +1347,14 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
     self.setCompilers.pushLanguage('C')
     flags_to_try = ['','-std=c99','-std=gnu99','-std=c11','-std=gnu11','-c99']
     for flag in flags_to_try:
-      self.setCompilers.saveLog()
-      if self.setCompilers.checkCompilerFlag(flag, includes, body):
-        self.logWrite(self.setCompilers.restoreLog())
+      with self.setCompilers.loggedProbe():
+        accepted = self.setCompilers.checkCompilerFlag(flag, includes, body)
+      if accepted:
         self.c99flag = flag
         if flag:
           self.setCompilers.CPPFLAGS += ' ' + flag
         self.framework.logPrint('Accepted C99 compile flag: '+flag)
         break
-      else:
-        self.logWrite(self.setCompilers.restoreLog())
     self.setCompilers.popLanguage()
     if self.c99flag is None:
       if self.isGCC: additionalErrorMsg = '\nPerhaps you have an Intel compiler environment or module set that is interfering with the GNU compilers.\nTry removing that environment or module and running ./configure again.'
@@ -1437,7 +1378,10 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
     dcount++;
     atomic_flag_clear(&cat);
     """
-    if self.checkCompile(includes, body):
+    # the test is compiled with the current language, C, for both calls so it only needs to run once
+    if self.stdAtomic is None:
+      self.stdAtomic = self.checkCompile(includes, body)
+    if self.stdAtomic:
       if cxx:
         self.addDefine('HAVE_CXX_ATOMIC', 1)
       else:
@@ -1446,7 +1390,7 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
   def configure(self):
     import config.setCompilers
     if hasattr(self.setCompilers, 'CC'):
-      self.isGCC = config.setCompilers.Configure.isGNU(self.setCompilers.CC, self.log)
+      self.isGCC = self.isCompiler('isGNU', 'C')
       self.executeTest(self.checkLinux)
       self.executeTest(self.checkC99Flag)
       self.executeTest(self.checkCFormatting)
@@ -1459,17 +1403,17 @@ Otherwise you need a different combination of C, C++, and Fortran compilers")
       self.isGCC = 0
 
     if hasattr(self.setCompilers, 'CXX'):
-      self.isGCXX = config.setCompilers.Configure.isGNU(self.setCompilers.CXX, self.log)
+      self.isGCXX = self.isCompiler('isGNU', 'Cxx')
       self.executeTest(self.checkCxxRestrict)
       # Adding -x c++ it causes Clang to SEGV, http://llvm.org/bugs/show_bug.cgi?id=12924
-      if not config.setCompilers.Configure.isClang(self.setCompilers.CXX, self.log):
+      if not self.isCompiler('isClang', 'Cxx'):
         self.executeTest(self.checkCxxOptionalExtensions)
       self.executeTest(self.checkCxxComplexFix)
       self.executeTest(self.checkStdAtomic,kargs={'cxx' : True})
       if self.argDB['with-cxxlib-autodetect']:
         self.executeTest(self.checkCxxLibraries)
       # To skip Sun C++ compiler warnings/errors
-      if config.setCompilers.Configure.isSun(self.setCompilers.CXX, self.log):
+      if self.isCompiler('isSun', 'Cxx'):
         self.addDefine('HAVE_SUN_CXX', 1)
     else:
       self.isGCXX = 0
@@ -1260,21 +1260,30 @@ class Configure(config.base.Configure):
     setattr(self,setPreviouslyAttrName,explicit)
     return
 
-  def checkCompiler(self, language, linkLanguage=None,includes = '', body = '', cleanup = 1, codeBegin = None, codeEnd = None):
-    """Check that the given compiler is functional, and if not raise an exception"""
+  def checkCompiler(self, language, linkLanguage=None,includes = '', body = '', cleanup = 1, codeBegin = None, codeEnd = None, runFirst = False):
+    """Check that the given compiler is functional, and if not raise an exception
+       With runFirst the default test program is run before the separate compile and link checks, this saves
+       building it three times where the check is expected to pass"""
     with self.Language(language):
       compiler = self.getCompiler()
-      if not self.checkCompile(includes=includes,body=body,cleanup=cleanup,codeBegin=codeBegin,codeEnd=codeEnd):
-        msg = 'Cannot compile {} with {}.'.format(language,compiler)
-        raise RuntimeError(msg)
+      # running the default test program also shows that it compiles and links, so try that first and
+      # only go through the individual steps (to get the proper error message) if it fails
+      ran = triedRun = 0
+      if runFirst and not includes and not body and cleanup and codeBegin is None and codeEnd is None and not self.argDB['with-batch'] and not language.upper() in {'CUDA','HIP','SYCL'}:
+        triedRun = 1
+        ran = self.checkRun(linkLanguage=linkLanguage)
+      if not ran:
+        if not self.checkCompile(includes=includes,body=body,cleanup=cleanup,codeBegin=codeBegin,codeEnd=codeEnd):
+          msg = 'Cannot compile {} with {}.'.format(language,compiler)
+          raise RuntimeError(msg)
 
-      if language.upper() in {'CUDA','HIP','SYCL'}:
-        # do not check CUDA/HIP/SYCL linkers since they are never used (assumed for now)
-        return
-      if not self.checkLink(linkLanguage=linkLanguage,includes=includes,body=body):
-        msg = 'Cannot compile/link {} with {}.'.format(language,compiler)
-        msg = '\nIf the above linker messages do not indicate failure of the compiler you can rerun with the option --ignoreLinkOutput=1'
-        raise RuntimeError(msg)
+        if language.upper() in {'CUDA','HIP','SYCL'}:
+          # do not check CUDA/HIP/SYCL linkers since they are never used (assumed for now)
+          return
+        if not self.checkLink(linkLanguage=linkLanguage,includes=includes,body=body):
+          msg = 'Cannot compile/link {} with {}.'.format(language,compiler)
+          msg = '\nIf the above linker messages do not indicate failure of the compiler you can rerun with the option --ignoreLinkOutput=1'
+          raise RuntimeError(msg)
       oldlibs     = self.LIBS
       compilerObj = self.framework.getCompilerObject(linkLanguage if linkLanguage else language)
       if not hasattr(compilerObj,'linkerrorcodecheck'):
@@ -1289,8 +1298,9 @@ class Configure(config.base.Configure):
           raise RuntimeError(msg)
         self.LIBS = oldlibs
         compilerObj.linkerrorcodecheck = 1
-      if not self.argDB['with-batch']:
-        if not self.checkRun(linkLanguage=linkLanguage):
+      if not ran and not self.argDB['with-batch']:
+        # a failed early run is not repeated, the compile and link checks above show it is the run that fails
+        if triedRun or not self.checkRun(linkLanguage=linkLanguage):
           msg = '\n'.join((
             'Cannot run executables created with {language}. If this machine uses a batch system ',
             'to submit jobs you will need to configure using ./configure with the additional option  --with-batch. ',
@@ -2031,6 +2041,15 @@ class Configure(config.base.Configure):
         oldLang = self.popLanguage()
       setattr(self,flagsArg,oldCompilerFlags)
 
+  @contextlib.contextmanager
+  def loggedProbe(self):
+    '''Collects the log of the enclosed checks with saveLog() and writes it out on exit, also when a check raises'''
+    self.saveLog()
+    try:
+      yield
+    finally:
+      self.logWrite(self.restoreLog())
+
   def checkPragma(self):
     '''Check for all available applicable languages whether they complain (including warnings!) about potentially unknown pragmas'''
     usePragma = {}
@@ -18,7 +18,7 @@ import pickle
 
 
 def main(args):
-  file = open('classes.data')
+  file = open('classes.data','rb')
   enums   = pickle.load(file)
   senums  = pickle.load(file)
   structs = pickle.load(file)
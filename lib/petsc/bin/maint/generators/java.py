@@ -31,7 +31,7 @@ def replace(enums,senums,structs,aliases,classes,k):
   return k
 
 def main(args):
-  file = open('classes.data')
+  file = open('classes.data','rb')
   enums   = pickle.load(file)
   senums  = pickle.load(file)
   structs = pickle.load(file)
@@ -23,7 +23,7 @@ enums = {}
 
 
 def main(args):
-  file = open('classes.data')
+  file = open('classes.data','rb')
   enums   = pickle.load(file)
   senums  = pickle.load(file)
   structs = pickle.load(file)
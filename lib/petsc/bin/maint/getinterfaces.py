@@ -23,29 +23,43 @@ aliases = {}
 senums = {} # like enums except strings instead of integer values
 structs = {}
 
-
-def getenums(filename):
-  import re
-  regtypedef  = re.compile(r'typedef [ ]*enum')
-  regcomment  = re.compile(r'/\* [A-Za-z _(),<>|^\*]* \*/')
-  reg         = re.compile(r'}')
-  regblank    = re.compile(r' [ ]*')
-  regname     = re.compile(r'}[ A-Za-z]*')
-  f = open(filename)
-  line = f.readline()
+# regular expressions used by the parsers below, compiled once for all of the header files;
+# except for enums the declarations are only looked for at the start of a line with match()
+regenum     = re.compile(r'typedef [ ]*enum')
+regstruct   = re.compile(r'typedef [ ]*struct {')
+regclass    = re.compile(r'typedef struct _[pn]_[A-Za-z_]*[ ]*\*')
+regdefine   = re.compile(r'#define [A-Za-z]*Type ')
+regfun      = re.compile(r'EXTERN PetscErrorCode PETSC[A-Z]*_DLLEXPORT ')
+regcomment  = re.compile(r'/\* [A-Za-z _(),<>|^\*]* \*/')
+regstructcomment = re.compile(r'/\* [A-Za-z _(),<>|^\*/0-9.]* \*/')
+regclose    = re.compile(r'}')
+regblank    = re.compile(r' [ ]*')
+regname     = re.compile(r'}[ A-Za-z]*')
+regarg      = re.compile(r'\([A-Za-z*_\[\]]*[,\)]')
+
+# characters deleted from the enum and class declarations
+enumdelete  = str.maketrans('','','\\\n;')
+classdelete = str.maketrans('','',' ;\n')
+
+
+def readheader(filename):
+  '''Returns the lines of a header file, it is read once and then scanned by each of the parsers below'''
+  with open(filename) as f:
+    return f.readlines()
+
+def getenums(lines):
+  lines = iter(lines)
+  line = next(lines,'')
   while line:
-    fl = regtypedef.search(line)
+    fl = regenum.search(line)
     if fl:
       struct = line
       while line:
-        fl = reg.search(line)
+        fl = regclose.search(line)
         if fl:
-          struct = struct.replace("\\","")
-          struct = struct.replace("\n","")
-          struct = struct.replace(";","")
-          struct = struct.replace("typedef enum","")
+          struct = struct.translate(enumdelete).replace("typedef enum","")
           struct = regcomment.sub("",struct)
-          struct = regblank.sub(" ",struct)
+          struct = " ".join(struct.split())
 
           name = regname.search(struct)
           name = name.group(0)
@@ -55,8 +69,7 @@ def getenums(filename):
           values = values.split(",")
 
           if struct.find("=") == -1:
-            for i in range(len(values)):
-              values[i] = values[i] + " = " + str(i)
+            values = [value + " = " + str(i) for i,value in enumerate(values)]
 
           ivalues = []
           for i in values:
@@ -65,52 +78,41 @@ def getenums(filename):
 
           enums[name] = ivalues
           break
-        line = f.readline()
+        line = next(lines,'')
         struct = struct + line
-    line = f.readline()
-  f.close()
+    line = next(lines,'')
 
-def getsenums(filename):
-  import re
-  regdefine   = re.compile(r'#define [A-Za-z]*Type ')
-  regblank    = re.compile(r' [ ]*')
-  f = open(filename)
-  line = f.readline()
+def getsenums(lines):
+  lines = iter(lines)
+  line = next(lines,'')
   while line:
-    fl = regdefine.search(line)
+    fl = regdefine.match(line)
     if fl:
       senum = fl.group(0)[8:-1]
       senums[senum] = {}
-      line = regblank.sub(" ",f.readline().strip())
+      line = regblank.sub(" ",next(lines,'').strip())
       while line:
         values = line.split(" ")
         senums[senum][values[1]] = values[2]
-        line = regblank.sub(" ",f.readline().strip())
-    line = f.readline()
-  f.close()
+        line = regblank.sub(" ",next(lines,'').strip())
+    line = next(lines,'')
 
-def getstructs(filename):
-  import re
-  regtypedef  = re.compile(r'^typedef [ ]*struct {')
-  regcomment  = re.compile(r'/\* [A-Za-z _(),<>|^\*/0-9.]* \*/')
-  reg         = re.compile(r'}')
-  regblank    = re.compile(r' [ ]*')
-  regname     = re.compile(r'}[ A-Za-z]*')
-  f = open(filename)
-  line = f.readline()
+def getstructs(lines):
+  lines = iter(lines)
+  line = next(lines,'')
   while line:
-    fl = regtypedef.search(line)
+    fl = regstruct.match(line)
     if fl:
       struct = line
       while line:
-        fl = reg.search(line)
+        fl = regclose.search(line)
         if fl:
           struct = struct.replace("\\","")
           struct = struct.replace("\n","")
           struct = struct.replace("typedef struct {","")
           struct = regblank.sub(" ",struct)
           struct = struct.replace("; ",";")
-          struct = regcomment.sub("",struct)
+          struct = regstructcomment.sub("",struct)
 
           name = regname.search(struct)
           name = name.group(0)
@@ -125,52 +127,33 @@ def getstructs(filename):
             ivalues.append(i)
           structs[name] = ivalues
           break
-        line = f.readline()
+        line = next(lines,'')
         struct = struct + line
-    line = f.readline()
-  f.close()
+    line = next(lines,'')
 
-def getclasses(filename):
-  import re
-  regclass    = re.compile(r'typedef struct _[pn]_[A-Za-z_]*[ ]*\*')
-  regcomment  = re.compile(r'/\* [A-Za-z _(),<>|^\*]* \*/')
-  regblank    = re.compile(r' [ ]*')
-  regsemi     = re.compile(r';')
-  f = open(filename)
-  line = f.readline()
+def getclasses(lines):
+  lines = iter(lines)
+  line = next(lines,'')
   while line:
-    fl = regclass.search(line)
+    fl = regclass.match(line)
     if fl:
       struct = line
       struct = regclass.sub("",struct)
       struct = regcomment.sub("",struct)
-      struct = regblank.sub("",struct)
-      struct = regsemi.sub("",struct)
-      struct = struct.replace("\n","")
+      struct = struct.translate(classdelete)
       classes[struct] = {}
-    line = f.readline()
-
-  f.close()
-
-def getfunctions(filename):
-  import re
-  regfun      = re.compile(r'EXTERN PetscErrorCode PETSC[A-Z]*_DLLEXPORT ')
-  regcomment  = re.compile(r'/\* [A-Za-z _(),<>|^\*]* \*/')
-  regblank    = re.compile(r' [ ]*')
-  regarg      = re.compile(r'\([A-Za-z*_\[\]]*[,\)]')
-  regerror    = re.compile(r'PetscErrorCode')
+    line = next(lines,'')
 
+def getfunctions(lines):
   rejects     = ['PetscErrorCode','DALocalFunction','...','<','(*)','(**)','off_t','MPI_Datatype','va_list','size_t','PetscStack']
   #
   # search through list BACKWARDS to get the longest match
   #
-  classlist   = classes.keys()
-  classlist.sort()
-  classlist.reverse()
-  f = open(filename)
-  line = f.readline()
+  classlist   = sorted(classes,reverse=True)
+  lines = iter(lines)
+  line = next(lines,'')
   while line:
-    fl = regfun.search(line)
+    fl = regfun.match(line)
     if fl:
       struct = line
       struct = regfun.sub("",struct)
@@ -200,9 +183,8 @@ def getfunctions(filename):
               break
 
 
-    line = f.readline()
+    line = next(lines,'')
 
-  f.close()
 #
 #  For now, hardwire aliases
 #
@@ -226,13 +208,7 @@ def getaliases():
   aliases['hid_t']              = 'int'
 
 def main(args):
-  for i in args:
-    getenums(i)
-  for i in args:
-    getsenums(i)
   getaliases()
-  for i in args:
-    getstructs(i)
   # this classes ONLY have static methods
   classes['Petsc'] = {}
   classes['PetscLog'] = {}
@@ -242,16 +218,21 @@ def main(args):
   classes['PetscOptions'] = {}
   classes['PetscMalloc'] = {}
   classes['PetscToken'] = {}
+  headers = []
   for i in args:
-    getclasses(i)
-  for i in args:
-    getfunctions(i)
-  file = open('classes.data','w')
-  pickle.dump(enums,file)
-  pickle.dump(senums,file)
-  pickle.dump(structs,file)
-  pickle.dump(aliases,file)
-  pickle.dump(classes,file)
+    lines = readheader(i)
+    getenums(lines)
+    getsenums(lines)
+    getstructs(lines)
+    getclasses(lines)
+    headers.append(lines)
+  # the functions are matched against the classes from all of the headers
+  for lines in headers:
+    getfunctions(lines)
+  # the generators load the tables back one at a time in this order
+  with open('classes.data','wb') as file:
+    for table in [enums,senums,structs,aliases,classes]:
+      pickle.dump(table,file,protocol=pickle.HIGHEST_PROTOCOL)
 
 
 
@@ -4,9 +4,10 @@ import os
 import sys
 import importlib
 import datetime as date
+import re
 
 # Check to ensure that the environmental variable PETSC_DIR has been assigned.
-# MPLCONFIGDIR is needed for matplotlib
+# MPLCONFIGDIR is needed for matplotlib, which is only imported by graphGen
 try:
     if os.environ.get('PETSC_DIR') is None:
         raise NotADirectoryError()
@@ -16,14 +17,15 @@ except NotADirectoryError:
     sys.exit('The environmental variable PETSC_DIR was not found.\n'
              'Please add this variable with the base directory for PETSc or the base directory that MPLCONFIGDIR resides')
 
-import matplotlib.pyplot as plt
 import argparse
 import math
 import configureTAS as config
-import pandas as pd
 from tasClasses import File
 from tasClasses import Field
 
+# Matches the filePath['<alias>']=... lines of configureTAS.py
+filePathRE = re.compile(r"^filePath\['([^']+)'\]=")
+
 def main(cmdLineArgs):
     data = []
     # This section handles the command arguments that edit configurTas.py
@@ -205,44 +207,36 @@ def editConfigureTasFile(alias, mode, aliasInConfig=False, path=None):
     """
 
     linesToWrite = []
+    aliasLine = f"filePath['{alias}']='{path}'\n"
+    aliasWritten = False
     with open('configureTAS.py', 'r') as configureTASFile:
         for line in configureTASFile:
+            # Only the filePath assignments are edited, they are matched by their alias
+            match = filePathRE.match(line)
+            lineAlias = match.group(1) if match else None
             if mode == 'add':
-                if aliasInConfig:
-                    if alias in line:
-                        linesToWrite.append(
-                            'filePath[\'' + alias + '\']=' + '\'' + path + '\'\n')
-                    else:
-                        linesToWrite.append(line)
-                else:
-                    if 'defaultData' in line:
-                        linesToWrite.append(line)
-                        linesToWrite.append(
-                            'filePath[\'' + alias + '\']=' + '\'' + path + '\'\n')
-                    else:
-                        linesToWrite.append(line)
-            else:
-                if alias in line:
-                    continue
+                if aliasInConfig and lineAlias == alias:
+                    linesToWrite.append(aliasLine)
+                    aliasWritten = True
                 else:
                     linesToWrite.append(line)
+                    if not aliasInConfig and lineAlias == 'defaultData':
+                        linesToWrite.append(aliasLine)
+                        aliasWritten = True
+            elif lineAlias != alias:
+                linesToWrite.append(line)
 
     with open('configureTAS.py', 'w') as configureTASFile:
         configureTASFile.writelines(linesToWrite)
 
-    # Code to make sure configureTAS was updated.
-    importlib.reload(config)
-
+    # Keep the imported filePath in step with the file instead of reloading configureTAS
     if mode == 'add':
-        if alias in config.filePath:
-            return True
-        else:
-            return False
+        if aliasWritten:
+            config.filePath[alias] = path
+        return aliasWritten
     else:
-        if alias not in config.filePath:
-            return True
-        else:
-            return False
+        config.filePath.pop(alias, None)
+        return True
 
 
 def getFiles(cmdLineArgs, alias):
@@ -265,15 +259,16 @@ def getFiles(cmdLineArgs, alias):
             if not config.filePath[alias]:
                 raise NotADirectoryError()
             dataPath = config.filePath[alias]
-            filesTemp = os.listdir(dataPath)
-            for f in filesTemp:
-                if f[-3:] == '.py':
-                    files['module'].append(f[0:len(f)-3])
-                elif f[-4:] == '.pyc':
-                    files['module'].append(f[0:len(f)-4])
-                elif f[-4:] == '.csv':
-                    files['csv'].append(f)
-            if len(filesTemp) == 0 or len(files) == 0:
+            numEntries = 0
+            with os.scandir(dataPath) as entries:
+                for entry in entries:
+                    numEntries += 1
+                    f = entry.name
+                    if f.endswith(('.py', '.pyc')):
+                        files['module'].append(f.rsplit('.', 1)[0])
+                    elif f.endswith('.csv'):
+                        files['csv'].append(f)
+            if numEntries == 0 or len(files) == 0:
                 raise IOError()
         except NotADirectoryError:
             print(f'The path for {alias} in configureTAS.py is empty and no valid file was specified using the -file/-f argument. \n'
@@ -288,7 +283,7 @@ def getFiles(cmdLineArgs, alias):
             if not os.path.exists(file):
                 print(f'{file} is not a valid path or file name')
             else:
-                if file[-4:] == '.csv':
+                if file.endswith('.csv'):
                     print('csv file')
                     files['csv'].append(file)
                 else:
@@ -313,38 +308,31 @@ def dataProcesCSV(cmdLineArgs, fileName):
     data = {}
     results = []
 
+    # Files found through an alias are relative to its path, files from -file/-f to the working directory
+    filePath = fileName
     if(cmdLineArgs.file == None):
         if cmdLineArgs.pathAliasData == None:
-            os.chdir(config.filePath['defaultData'])
+            filePath = os.path.join(config.filePath['defaultData'], fileName)
         else:
-            os.chdir(config.filePath[cmdLineArgs.pathAliasData[0]])
-
-    if('/' in fileName):
-        path_fileName = os.path.split(fileName)
-        os.chdir(path_fileName[0])
-        fileName = path_fileName[1]
-
-    df = pd.read_csv(fileName)
+            filePath = os.path.join(config.filePath[cmdLineArgs.pathAliasData[0]], fileName)
+    fileName = os.path.basename(fileName)
+
+    import pandas as pd
+    df = pd.read_csv(filePath)
+    # The names repeat for every rank, as categories the filters below compare integer codes instead of strings
+    df['Event Name'] = df['Event Name'].astype('category')
+    df['Stage Name'] = df['Stage Name'].astype('category')
     Nf = getNfCSV(df)
     nProcs = int(df.columns.tolist()[25])
-    dofs = []
-    errors = []
 
     times = []
     timesMin = []
     meanTime = []
-    timeGrowthRate = []
 
     flops = []
     flopsMax = []
     flopsMin = []
     meanFlop = []
-    flopGrowthRate = []
-
-    luFactor = []
-    luFactorMin = []
-    luFactorMean = []
-    luFactorGrowthRate = []
 
     file = File(fileName[0:len(fileName)-4])
 
@@ -372,70 +360,49 @@ def dataProcesCSV(cmdLineArgs, fileName):
     else:
         SolverFilter = TSStepFilter
 
-    for f in range(Nf):
-        errors.append([])
-    for f in range(Nf):
-        dofs.append([])
-
-    level = 0
-    while level >= 0:
-        if ('ConvEst Refinement Level ' + str(level) in df['Stage Name'].values):
-            stageName = 'ConvEst Refinement Level '+str(level)
-            #Level dependent filters
-            stageNameFilter = (df['Stage Name'] == stageName)
-            fieldFilter = stageNameFilter & ConvEstErrorFilter & rankFilter
-
-            SolverDf = df.loc[stageNameFilter & SolverFilter]
-
-            MatLUFactorDf = df.loc[(stageNameFilter & MatLUFactorFilter), [
-                                    'Time', 'Rank']]
-            # groupby done in order to get the sum of MatLUFactorNum and MatLUFactorSym
-            # For each Rank/CPU
-            MatLUFactorDf = MatLUFactorDf.groupby(['Rank']).sum()
-
-            meanTime.append((SolverDf['Time'].sum())/nProcs)
-            times.append(SolverDf['Time'].max())
-            timesMin.append(SolverDf['Time'].min())
-
-            meanFlop.append((SolverDf['FLOP'].sum())/nProcs)
-            flops.append(SolverDf['FLOP'].sum())
-            flopsMax.append(SolverDf['FLOP'].max())
-            flopsMin.append(SolverDf['FLOP'].min())
-
-            if level >= 1:
-                timeGrowthRate.append(meanTime[level]/meanTime[level-1])
-                flopGrowthRate.append(meanFlop[level]/meanFlop[level-1])
-
-            luFactorMean.append(MatLUFactorDf.sum()/nProcs)
-            luFactor.append(MatLUFactorDf.max())
-            luFactorMin.append(MatLUFactorDf.min())
-
-            for f in range(Nf):
-                dofs[f].append((df.loc[fieldFilter])['dof'+str(f)].values[0])
-                errors[f].append((df.loc[fieldFilter])['e'+str(f)].values[0])
-
-            level = level + 1
-        else:
-            level = -1
-
-    dofs = np.array(dofs, dtype=object)
-    errors = np.array(errors, dtype=object)
+    # Aggregate all the levels in a single pass over the Data Frame, the loop below only looks up its level
+    SolverAgg = df.loc[SolverFilter].groupby('Stage Name', observed=True)[['Time', 'FLOP']].agg(['sum', 'max', 'min'])
+    # groupby done in order to get the sum of MatLUFactorNum and MatLUFactorSym
+    # For each Rank/CPU, unstacked into a table with a row for each stage and a column for each rank
+    MatLUFactorDf = df.loc[MatLUFactorFilter].groupby(['Stage Name', 'Rank'], observed=True)['Time'].sum().unstack('Rank')
+    fieldDf = df.loc[ConvEstErrorFilter & rankFilter].drop_duplicates('Stage Name').set_index('Stage Name')
+
+    stageNames = getStageNames(set(df['Stage Name'].cat.categories))
+    # A level without solver events gets sums of 0 and NaN for the max and min, as a filter for each level gave
+    SolverAgg = SolverAgg.reindex(stageNames).fillna({('Time', 'sum'): 0, ('FLOP', 'sum'): 0})
+    for stageName in stageNames:
+        meanTime.append(SolverAgg.at[stageName, ('Time', 'sum')]/nProcs)
+        times.append(SolverAgg.at[stageName, ('Time', 'max')])
+        timesMin.append(SolverAgg.at[stageName, ('Time', 'min')])
+
+        meanFlop.append(SolverAgg.at[stageName, ('FLOP', 'sum')]/nProcs)
+        flops.append(SolverAgg.at[stageName, ('FLOP', 'sum')])
+        flopsMax.append(SolverAgg.at[stageName, ('FLOP', 'max')])
+        flopsMin.append(SolverAgg.at[stageName, ('FLOP', 'min')])
+
+    # The dofs and errors of all the levels as [field, level] arrays
+    fieldDf = fieldDf.loc[stageNames]
+    dofs = fieldDf[['dof'+str(f) for f in range(Nf)]].to_numpy(dtype=np.float64).T
+    errors = fieldDf[['e'+str(f) for f in range(Nf)]].to_numpy(dtype=np.float64).T
 
     times = np.array(times)
     meanTime = np.array(meanTime)
     timesMin = np.array(timesMin)
-    timeGrowthRate = np.array(timeGrowthRate)
 
     flops = np.array(flops)
     meanFlop = np.array(meanFlop)
     flopsMax = np.array(flopsMax)
     flopsMin = np.array(flopsMin)
-    flopGrowthRate = np.array(flopGrowthRate)
 
-    luFactor = np.array(luFactor)
-    luFactorMin = np.array(luFactorMin)
-    luFactorMean = np.array(luFactorMean)
-    luFactorGrowthRate = np.array(luFactorGrowthRate)
+    MatLUFactorDf = MatLUFactorDf.reindex(stageNames)
+    luFactor = MatLUFactorDf.max(axis=1).to_numpy()
+    luFactorMin = MatLUFactorDf.min(axis=1).to_numpy()
+    luFactorMean = MatLUFactorDf.sum(axis=1).to_numpy()/nProcs
+
+    #Calculates the growth rate of statistics between levels
+    timeGrowthRate = meanTime[1:]/meanTime[:-1]
+    flopGrowthRate = meanFlop[1:]/meanFlop[:-1]
+    luFactorGrowthRate = luFactorMean[1:]/luFactorMean[:-1]
 
     data['Times'] = times
     data['Mean Time'] = meanTime
@@ -514,24 +481,6 @@ def dataProces(cmdLineArgs, fileName):
     Nf = getNf(module.Stages['ConvEst Refinement Level 1']
                ['ConvEst Error'][0]['error'])
     nProcs = module.size
-    dofs = []
-    errors = []
-
-    times = []
-    timesMin = []
-    meanTime = []
-    timeGrowthRate = []
-
-    flops = []
-    flopsMax = []
-    flopsMin = []
-    meanFlop = []
-    flopGrowthRate = []
-
-    luFactor = []
-    luFactorMin = []
-    luFactorMean = []
-    luFactorGrowthRate = []
 
     file = File(module.__name__)
 
@@ -546,108 +495,40 @@ def dataProces(cmdLineArgs, fileName):
             sys.exit('The problem you specified on the command line: ' + cmdLineArgs.problem + ' \ncould not be found'
                      ' please check ' + config.__file__ + ' to ensure that you are using the correct name/have defined the fields for the problem.')
 
-    for f in range(Nf):
-        errors.append([])
-    for f in range(Nf):
-        dofs.append([])
-
-    level = 0
-    while level >= 0:
-        stageName = 'ConvEst Refinement Level '+str(level)
-        if stageName in module.Stages:
-            timeTempMax = module.Stages[stageName]['SNESSolve'][0]['time']
-            timeTempMin = module.Stages[stageName]['SNESSolve'][0]['time']
-            totalTime = module.Stages[stageName]['SNESSolve'][0]['time']
-
-            flopsTempMax = module.Stages[stageName]['SNESSolve'][0]['flop']
-            flopsTempMin = module.Stages[stageName]['SNESSolve'][0]['flop']
-            totalFlop = module.Stages[stageName]['SNESSolve'][0]['flop']
-
-            luFactorTempMax = module.Stages[stageName]['MatLUFactorNum'][0]['time'] + \
-                module.Stages[stageName]['MatLUFactorSym'][0]['time']
-            luFactorTempMin = luFactorTempMax
-            totalLuFactor = luFactorTempMax
-
-            #This loops is used to grab the greatest time and flop when run in parallel
-            for n in range(1, nProcs):
-                #Sum of MatLUFactorNum and MatLUFactorSym
-                if module.Stages[stageName]['MatLUFactorNum'][n]['time'] != 0:
-                    luFactorCur = module.Stages[stageName]['MatLUFactorNum'][n]['time'] + \
-                        module.Stages[stageName]['MatLUFactorSym'][n]['time']
-
-                #Gather Time information
-                timeTempMax = timeTempMax if timeTempMax >= module.Stages[stageName]['SNESSolve'][n]['time'] \
-                    else module.Stages[stageName]['SNESSolve'][n]['time']
-                timeTempMin = timeTempMin if timeTempMin <= module.Stages[stageName]['SNESSolve'][n]['time'] \
-                    else module.Stages[stageName]['SNESSolve'][n]['time']
-                totalTime = totalTime + \
-                    module.Stages[stageName]['SNESSolve'][n]['time']
-
-                #Gather Flop information
-                flopsTempMax = flopsTempMax if flopsTempMax >= module.Stages[stageName]['SNESSolve'][n]['flop'] \
-                    else module.Stages[stageName]['SNESSolve'][n]['flop']
-                flopsTempMin = flopsTempMin if flopsTempMin <= module.Stages[stageName]['SNESSolve'][n]['flop'] \
-                    else module.Stages[stageName]['SNESSolve'][n]['flop']
-                totalFlop = totalFlop + \
-                    module.Stages[stageName]['SNESSolve'][n]['flop']
-
-                if module.Stages[stageName]['MatLUFactorNum'][n]['time'] != 0:
-                    luFactorTempMax = luFactorTempMax if luFactorTempMax >= luFactorCur \
-                            else luFactorCur
-                    luFactorTempMin = luFactorTempMin if luFactorTempMin <= luFactorCur \
-                        else luFactorCur
-                    totalLuFactor = totalLuFactor + luFactorCur
-
-            meanTime.append(totalTime/nProcs)
-            times.append(timeTempMax)
-            timesMin.append(timeTempMin)
-
-            meanFlop.append(totalFlop/nProcs)
-            flops.append(totalFlop)
-            flopsMax.append(flopsTempMax)
-            flopsMin.append(timeTempMin)
-            if module.Stages[stageName]['MatLUFactorNum'][n]['time'] != 0:
-                luFactor.append(luFactorTempMax)
-                luFactorMin.append(luFactorTempMin)
-                luFactorMean.append(totalLuFactor/nProcs)
-
-            #Calculates the growth rate of statistics between levels
-            if level >= 1:
-                timeGrowthRate.append(meanTime[level]/meanTime[level-1])
-                flopGrowthRate.append(meanFlop[level]/meanFlop[level-1])
-
-            #TODO FOR SNES
-            #if module.Stages[stageName]['MatLUFactorNum'][n]['time'] != 0:
-            #    luFactorGrowthRate.append(luFactorMean[level-1]/luFactorMean[level-2])
-
-            for f in range(Nf):
-                dofs[f].append(module.Stages[stageName]
-                               ['ConvEst Error'][0]['dof'][f])
-                errors[f].append(module.Stages[stageName]
-                                 ['ConvEst Error'][0]['error'][f])
-
-            level = level + 1
-        else:
-            level = -1
-
-    dofs = np.array(dofs)
-    errors = np.array(errors)
-
-    times = np.array(times)
-    meanTime = np.array(meanTime)
-    timesMin = np.array(timesMin)
-    timeGrowthRate = np.array(timeGrowthRate)
-
-    flops = np.array(flops)
-    meanFlop = np.array(meanFlop)
-    flopsMax = np.array(flopsMax)
-    flopsMin = np.array(flopsMin)
-    flopGrowthRate = np.array(flopGrowthRate)
-
-    luFactor = np.array(luFactor)
-    luFactorMin = np.array(luFactorMin)
-    luFactorMean = np.array(luFactorMean)
-    luFactorGrowthRate = np.array(luFactorGrowthRate)
+    stageNames = getStageNames(module.Stages)
+
+    #Gather the time, flop and LU factor information of all the levels and ranks
+    time = getEventArray(module.Stages, stageNames, 'SNESSolve', 'time', nProcs)
+    flop = getEventArray(module.Stages, stageNames, 'SNESSolve', 'flop', nProcs)
+    luFactorNum = getEventArray(module.Stages, stageNames, 'MatLUFactorNum', 'time', nProcs)
+    #Sum of MatLUFactorNum and MatLUFactorSym
+    luFactorCur = luFactorNum + getEventArray(module.Stages, stageNames, 'MatLUFactorSym', 'time', nProcs)
+    #The ranks other than 0 only count if they factored, a level only counts if its last rank factored
+    luFactorRanks = luFactorNum != 0
+    luFactorRanks[:, 0] = True
+    luFactorLevels = luFactorNum[:, -1] != 0
+
+    times = time.max(axis=1)
+    timesMin = time.min(axis=1)
+    meanTime = time.sum(axis=1)/nProcs
+
+    flops = flop.sum(axis=1)
+    flopsMax = flop.max(axis=1)
+    flopsMin = flop.min(axis=1)
+    meanFlop = flops/nProcs
+
+    luFactor = np.where(luFactorRanks, luFactorCur, -np.inf).max(axis=1)[luFactorLevels]
+    luFactorMin = np.where(luFactorRanks, luFactorCur, np.inf).min(axis=1)[luFactorLevels]
+    luFactorMean = np.where(luFactorRanks, luFactorCur, 0).sum(axis=1)[luFactorLevels]/nProcs
+
+    #Calculates the growth rate of statistics between levels
+    timeGrowthRate = meanTime[1:]/meanTime[:-1]
+    flopGrowthRate = meanFlop[1:]/meanFlop[:-1]
+    luFactorGrowthRate = luFactorMean[1:]/luFactorMean[:-1]
+
+    errorEvents = [module.Stages[stageName]['ConvEst Error'][0] for stageName in stageNames]
+    dofs = np.array([errorEvent['dof'][:Nf] for errorEvent in errorEvents], dtype=np.float64).T
+    errors = np.array([errorEvent['error'][:Nf] for errorEvent in errorEvents], dtype=np.float64).T
 
     data['Times'] = times
     data['Mean Time'] = meanTime
@@ -694,12 +575,42 @@ def getNf(errorList):
     return Nf
 
 
+def getStageNames(stages):
+    """
+    This function returns the names of the refinement level stages, ConvEst Refinement Level <level>, that are in
+    stages.  The levels are numbered consecutively starting at 0, so the first missing level ends the list.
+
+    :param stages: Contains the stage names, i.e. the Stages dictionary or a set of names.
+    :returns: stageNames a list of the stage names ordered by level.
+    """
+    stageNames = []
+    stageName = 'ConvEst Refinement Level 0'
+    while stageName in stages:
+        stageNames.append(stageName)
+        stageName = f'ConvEst Refinement Level {len(stageNames)}'
+    return stageNames
+
+
+def getEventArray(stages, stageNames, eventName, key, nProcs):
+    """
+    This function takes the Stages dictionary of an ASCII type data file and collects the value of key, i.e. time
+    or flop, of the event for every rank in each of the stages into a single NumPy array.
+
+    :param stages: Contains the Stages dictionary of the data file.
+    :param stageNames: Contains the names of the stages, one row of the array is created for each.
+    :param eventName: Contains the name of the event, i.e. SNESSolve.
+    :param key: Contains the name of the value to collect, i.e. time or flop.
+    :param nProcs: Contains the number of ranks.
+    :returns: a NumPy array of shape (number of stages, nProcs).
+    """
+    return np.array([[stages[stageName][eventName][n][key] for n in range(nProcs)] for stageName in stageNames])
+
+
 def getNfCSV(df):
     """
-    This simple function is the same as getNf, except it is for the CSV files. It loops through
-    the values of the dofx columns, where x is an integer, from the row where
-    Stage Name = ConvEst Refinement Level 0, Event Name = ConvEst Error, and Rank = 0 until it
-    encounters -1.  The default convention is that each field from the problem has an entry in the error list with at most
+    This simple function is the same as getNf, except it is for the CSV files. It looks for the first
+    of the dofx columns, where x is an integer, that is -1 in the row where
+    Stage Name = ConvEst Refinement Level 0, Event Name = ConvEst Error, and Rank = 0.  The default convention is that each field from the problem has an entry in the error list with at most
     8 fields.  If there are less than 8 fields those entries are set to -1.
 
     Example:
@@ -710,16 +621,12 @@ def getNfCSV(df):
     :returns: Nf an integer that represents the number of fields.
     """
     #Get a single row from the Data Frame that contains the field information
-    df = df.loc[(df['Event Name'] == 'ConvEst Error') & (df['Stage Name'] == 'ConvEst Refinement Level 0')
-                & (df['Rank'] == 0)].reset_index()
-    level = 1
-    while level >= 1:
-        dof = 'dof' + str(level)
-        if df.loc[0, dof] == -1:
-            break
-        else:
-            level = level + 1
-    return level
+    row = df.loc[(df['Event Name'] == 'ConvEst Error') & (df['Stage Name'] == 'ConvEst Refinement Level 0')
+                 & (df['Rank'] == 0)].iloc[0]
+    #There is always at least one field, so the search starts at dof1
+    dofs = row.filter(regex=r'^dof\d+$').to_numpy()
+    unused = np.flatnonzero(dofs[1:] == -1)
+    return int(unused[0]) + 1 if len(unused) else len(dofs)
 
 
 def graphGen(file, enable_graphs, graph_flops_scaling, dim):
@@ -740,19 +647,29 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
     """
     lstSqMeshConv = np.empty([2])
 
-    counter = 0
-    #Loop through each file and add the data/line for that file to the Mesh Convergence, Static Scaling, and Efficacy Graphs
+    #Errors that could not be calculated are set to 1, then all of the fields are fit at once when they have the
+    #same number of levels, otherwise one at a time
+    errorsMissing = []
     for field in file.fieldList:
-        #Least squares solution for Mesh Convergence
-        if isinstance(field.fieldData['Errors'][0], str) or field.fieldData['Errors'][0] == -1:
-            print('Mesh Convergence can not be calculated, nan values in Error field will change to 1')
+        errorsMissing.append(isinstance(field.fieldData['Errors'][0], str) or field.fieldData['Errors'][0] == -1)
+        if errorsMissing[-1]:
             for x in range(len(field.fieldData['Errors'])):
                 field.fieldData['Errors'][x] = 1
+    dofsList = [field.fieldData['dofs'] for field in file.fieldList]
+    errorsList = [field.fieldData['Errors'] for field in file.fieldList]
+    if len({len(values) for values in dofsList + errorsList}) <= 1:
+        alphas, betas = leastSquares(np.array(dofsList), np.array(errorsList))
+    else:
+        alphas, betas = zip(*[leastSquares(dofs, errors) for dofs, errors in zip(dofsList, errorsList)])
 
+    counter = 0
+    #Loop through each file and add the data/line for that file to the Mesh Convergence, Static Scaling, and Efficacy Graphs
+    for i, field in enumerate(file.fieldList):
+        #Least squares solution for Mesh Convergence
+        if errorsMissing[i]:
+            print('Mesh Convergence can not be calculated, nan values in Error field will change to 1')
 
-
-        lstSqMeshConv[0], lstSqMeshConv[1] = leastSquares(
-            field.fieldData['dofs'], field.fieldData['Errors'])
+        lstSqMeshConv[0], lstSqMeshConv[1] = alphas[i], betas[i]
         print('Least Squares Data')
         print('==================')
         print('Mesh Convergence')
@@ -766,6 +683,10 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
         field.setBeta(lstSqMeshConv[1])
 
     if cmdLineArgs.enable_graphs == 1:
+        #matplotlib and pandas are imported here so the alias editing commands do not pay for them
+        import matplotlib.pyplot as plt
+        import pandas as pd
+
         #Uses the specified style sheet for generating the plots
         styleDir = os.path.join(os.environ.get('PETSC_DIR'), 'lib/petsc/bin')
         plt.style.use(os.path.join(styleDir, 'petsc_tas_style.mplstyle'))
@@ -778,10 +699,10 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
             axMeshConv = meshConvFig.add_subplot(1, 1, 1)
             axMeshConv.set(xlabel='Problem Size $\log N$', ylabel='Error $\log |x - x^*|$', title='Mesh Convergence')
 
-        statScaleFig = plt.figure()
-        statScaleHandles = []
-        axStatScale = statScaleFig.add_subplot(1, 1, 1)
-        axStatScale.set(xlabel='Time(s)', ylabel='Flop Rate (F/s)', title='Static Scaling')
+        if graph_flops_scaling == 1:
+            statScaleFlopFig = plt.figure()
+            axStatScaleFlop = statScaleFlopFig.add_subplot(1, 1, 1)
+            axStatScaleFlop.set(xlabel='Time(s)', ylabel='Flop Rate (F/s)', title='Static Scaling')
 
         statScaleFig = plt.figure()
         statScaleHandles = []
@@ -794,6 +715,10 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
         axEffic.set(xlabel='Time(s)', ylabel='Error Time', title='Efficacy')
         axEffic.set_ylim(0, 10)
 
+        #The times and flop rate are the same for every field
+        times = file.fileData['Times'].astype(np.float64, copy=False)
+        flopRate = file.fileData['Flops']/times
+
         #Loop through each file and add the data/line for that file to the Mesh Convergence, Static Scaling, and Efficacy Graphs
         for field in file.fieldList:
             ##Start Mesh Convergence graph
@@ -804,23 +729,26 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
 
             meshConvOrigHandles.append(x)
 
-            y, = axMeshConv.loglog(field.fieldData['dofs'], ((field.fieldData['dofs']**lstSqMeshConv[0] * 10**lstSqMeshConv[1])),
+            #Least squares line of this field, dofs**alpha * 10**beta
+            lstSqLine = np.power(field.fieldData['dofs'], field.alpha)
+            lstSqLine *= 10**field.beta
+            y, = axMeshConv.loglog(field.fieldData['dofs'], lstSqLine,
                                    label=field.fieldName + ' Convergence rate =  ' + convRate, marker='x')
 
             #meshConvLstSqHandles.append(y)
 
             ##Start Static Scaling Graph, only if graph_flops_scaling equals 1.  Specified on the command line.
             if graph_flops_scaling == 1:
-                x, = axStatScale.loglog(file.fileData['Times'], file.fileData['Flops']/file.fileData['Times'],
-                                        label='Field ' + field.fieldName, marker='^')
+                x, = axStatScaleFlop.loglog(times, flopRate,
+                                            label='Field ' + field.fieldName, marker='^')
 
             ##Start Static Scaling with DoFs Graph
-            x, = axStatScale.loglog(file.fileData['Times'], field.fieldData['dofs']/file.fileData['Times'],
+            x, = axStatScale.loglog(times, field.fieldData['dofs']/times,
                                     label='Field ' + field.fieldName, marker='^')
 
             statScaleHandles.append(x)
             ##Start Efficacy graph
-            x, = axEffic.semilogx(file.fileData['Times'], -np.log10((field.fieldData['Errors']*file.fileData['Times']).astype(np.float64)),
+            x, = axEffic.semilogx(times, -np.log10(field.fieldData['Errors'].astype(np.float64, copy=False)*times),
                                   label='Field ' + field.fieldName, marker='^')
 
             efficHandles.append(x)
@@ -836,6 +764,9 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
         #statScaleLabels = [h.get_label() for h in statScaleHandles]
         #statScaleFig.legend(handles=statScaleHandles, labels=statScaleLabels)
         statScaleFig.legend()
+        if graph_flops_scaling == 1:
+            statScaleFlopFig.legend()
+            axStatScaleFlop.set_ylim(ymin=0.1)
 
         #efficLabels = [h.get_label() for h in efficHandles]
         #efficFig.legend(handles=efficHandles, labels=efficLabels)
@@ -876,6 +807,9 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
             config.filePath[pathAlias]+'meshConvergenceField_' + field.fileName + '.png')
         statScaleFig.savefig(
             config.filePath[pathAlias]+'staticScalingField_' + field.fileName + '.png')
+        if graph_flops_scaling == 1:
+            statScaleFlopFig.savefig(
+                config.filePath[pathAlias]+'staticScalingFlopsField_' + field.fileName + '.png')
         efficFig.savefig(
             config.filePath[pathAlias]+'efficacyField_' + field.fileName + '.png')
 
@@ -885,8 +819,9 @@ def graphGen(file, enable_graphs, graph_flops_scaling, dim):
 def leastSquares(x, y):
     """
     This function takes 2 numpy arrays of data and out puts the least squares solution,
-       y = m*x + c.  The solution is obtained by finding the result of y = Ap, where A
-       is the matrix of the form [[x 1]] and p = [[m], [c]].
+       y = m*x + c, of their base 10 logarithms.  For a line the solution has the closed form
+       m = sum((x - xMean)*(y - yMean))/sum((x - xMean)**2) and c = yMean - m*xMean.  The sums
+       are taken along the last axis, so 2D arrays with one row per field are fit row by row.
 
     :param x: Contains the x values for the data.
     :type x: numpy array
@@ -899,17 +834,12 @@ def leastSquares(x, y):
 
     x = np.log10(x.astype(np.float64))
     y = np.log10(y.astype(np.float64))
-    X = np.hstack((np.ones((x.shape[0], 1)), x.reshape((x.shape[0], 1))))
-
-    beta = np.dot(np.linalg.pinv(np.dot(X.transpose(), X)), X.transpose())
-    beta = np.dot(beta, y.reshape((y.shape[0], 1)))
-    A = np.hstack((np.ones((x.shape[0], 1)), x.reshape((x.shape[0], 1))))
-
-    AtranA = np.dot(A.T, A)
-
-    invAtranA = np.linalg.pinv(AtranA)
+    xMean = x.mean(axis=-1, keepdims=True)
+    yMean = y.mean(axis=-1, keepdims=True)
+    dx = x - xMean
 
-    return beta[1][0], beta[0][0]
+    alpha = (dx * (y - yMean)).sum(axis=-1) / (dx * dx).sum(axis=-1)
+    return alpha, yMean[..., 0] - alpha * xMean[..., 0]
 
 
 if __name__ == '__main__':